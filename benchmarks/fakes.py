@@ -0,0 +1,72 @@
+"""Stand-ins for the mouse, the speech recognizer and the display layout."""
+from pynput.mouse import Button
+
+from config import load_config
+from engine import MouseEngine
+from event_bus import ControlState, ControlStore, EventBus
+from screen_geometry import ScreenGeometry
+from voice_feedback import FeedbackService, MutedBackend
+
+
+class FakeMouse:
+    """Records what would have been sent to the pointer"""
+
+    def __init__(self, position=(960, 540)):
+        self.position = position
+        self.clicks = {Button.left: 0, Button.right: 0}
+        self.scrolled = 0
+
+    def click(self, button, count=1):
+        self.clicks[button] += count
+
+    def scroll(self, dx, dy):
+        self.scrolled += dy
+
+
+class FakeRecognizer:
+    """Does the local work of recognize_google, then returns scripted transcripts.
+
+    The audio is FLAC-encoded exactly as the real recognizer does before
+    its request, so the measured cost covers everything but the network
+    round trip.
+    """
+
+    def __init__(self, transcripts):
+        self.transcripts = list(transcripts)
+        self.index = 0
+        self.encoded_bytes = 0
+
+    def recognize_google(self, audio):
+        flac_data = audio.get_flac_data(
+            convert_rate=None if audio.sample_rate >= 8000 else 8000,
+            convert_width=2
+        )
+        self.encoded_bytes += len(flac_data)
+        transcript = self.transcripts[self.index % len(self.transcripts)]
+        self.index += 1
+        return transcript
+
+
+class FixedScreen(ScreenGeometry):
+    """ScreenGeometry with a fixed display layout instead of a system query"""
+
+    def __init__(self, layout=((0, 0, 1920, 1080),), **kwargs):
+        self.layout = tuple(layout)
+        super().__init__(**kwargs)
+
+    def query_monitors(self):
+        return self.layout
+
+
+def make_engine(transcripts=("click",), config=None):
+    """A MouseEngine with hand and voice control on, fake devices and muted feedback"""
+    bus = EventBus()
+    control = ControlStore(bus, ControlState(hand_active=True, voice_active=True))
+    config = config or load_config()
+    engine = MouseEngine(
+        bus, control, config=config,
+        mouse=FakeMouse(), recognizer=FakeRecognizer(transcripts),
+        screen=FixedScreen(active_region=config["active_region"]),
+        feedback=FeedbackService(MutedBackend())
+    )
+    return engine
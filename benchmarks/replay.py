@@ -0,0 +1,147 @@
+"""Replay a clip through the camera frame path and report speed and memory.
+
+    python -m benchmarks.replay [--video clip.mp4] [--frames 300]
+
+Each path runs in its own subprocess so peak RSS is measured separately:
+"naive" is the original allocate-per-step path and "pooled" uses
+FramePool. Without --video a synthetic 720p clip is generated. Both
+paths are measured the same way: wall-clock speed, the tracemalloc peak
+(numpy reports its array buffers to tracemalloc) and the process's peak
+RSS.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from frame_buffers import FramePool
+
+PREVIEW_SIZE = (640, 480)
+
+
+def synthetic_clip(count=8, shape=(720, 1280, 3), seed=0):
+    """A few distinct noisy frames with a moving bright square"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(count):
+        frame = rng.integers(0, 64, size=shape, dtype=np.uint8)
+        x = 100 + i * 100
+        frame[200:400, x:x + 200] = 220
+        frames.append(frame)
+    return frames
+
+
+class ClipSource:
+    """Loops over a video file, or over synthetic frames, like a camera"""
+
+    def __init__(self, video=None, frames=None):
+        self.cap = cv2.VideoCapture(video) if video else None
+        self.frames = None if video else frames if frames is not None else synthetic_clip()
+        self.index = 0
+
+    def read(self, image=None):
+        if self.cap is None:
+            frame = self.frames[self.index % len(self.frames)]
+            self.index += 1
+            if image is not None and image.shape == frame.shape:
+                np.copyto(image, frame)
+                return True, image
+            return True, frame.copy()
+        ret, frame = self.cap.read(image)
+        if not ret:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read(image)
+        return ret, frame
+
+
+def draw_overlay(frame):
+    """Stand-in for the landmark overlay: a fixed hand skeleton"""
+    height, width = frame.shape[:2]
+    points = [(int(width * (0.4 + 0.02 * i)), int(height * (0.7 - 0.02 * i))) for i in range(21)]
+    for start, end in zip(points, points[1:]):
+        cv2.line(frame, start, end, (255, 255, 255), 2)
+    for point in points:
+        cv2.circle(frame, point, 4, (0, 0, 255), -1)
+
+
+def run_naive(source, frames):
+    """The frame path as it was before FramePool"""
+    for _ in range(frames):
+        ret, frame = source.read()
+        frame = cv2.flip(frame, 1)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        overlay = frame.copy()
+        draw_overlay(overlay)
+        img = cv2.cvtColor(overlay, cv2.COLOR_BGR2RGB)
+        img = cv2.resize(img, PREVIEW_SIZE)
+
+
+def run_pooled(source, frames):
+    pool = FramePool(PREVIEW_SIZE)
+    for _ in range(frames):
+        captured = pool.read(source)
+        frame = pool.flip(captured)
+        rgb_frame = pool.rgb(frame)
+        overlay = pool.overlay(frame)
+        draw_overlay(overlay)
+        img = pool.preview(overlay)
+
+
+PATHS = {"naive": run_naive, "pooled": run_pooled}
+
+
+def peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(path, video, frames):
+    source = ClipSource(video)
+    PATHS[path](source, 5)  # warm up codecs and buffers
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    PATHS[path](source, frames)
+    elapsed = time.perf_counter() - started
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "path": path,
+        "fps": frames / elapsed,
+        "ms_per_frame": elapsed / frames * 1000,
+        "traced_peak_mb": traced_peak / 2**20,
+        "peak_rss_mb": peak_rss_bytes() / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="clip to replay instead of synthetic frames")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--path", choices=sorted(PATHS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.path:
+        print(json.dumps(measure(args.path, args.video, args.frames)))
+        return
+
+    print(f"{'path':<8} {'fps':>8} {'ms/frame':>9} {'traced MB':>10} {'peak RSS MB':>12}")
+    for path in PATHS:
+        command = [sys.executable, "-m", "benchmarks.replay", "--path", path, "--frames", str(args.frames)]
+        if args.video:
+            command += ["--video", args.video]
+        result = json.loads(subprocess.check_output(command))
+        print(f"{path:<8} {result['fps']:>8.1f} {result['ms_per_frame']:>9.2f} "
+              f"{result['traced_peak_mb']:>10.1f} {result['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
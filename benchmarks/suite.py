@@ -0,0 +1,290 @@
+"""Benchmark and regression suite for the tracking, gesture and voice hot paths.
+
+    python -m benchmarks.suite --record-clip      # record benchmarks/clip.mp4 from the camera
+    python -m benchmarks.suite                    # run and compare with the baseline
+    python -m benchmarks.suite --update-baseline  # record this machine's numbers
+    python -m benchmarks.suite --video other.mp4 --skip-inference
+
+The frame path replays benchmarks/clip.mp4, a short recording of one
+moving hand next to a still one, through the real engine with a fake
+mouse, so the tracker's search, follow and idle paths all run. The suite
+fails if that clip is missing or the tracker never found a hand in it.
+--synthetic replays a rendered hand silhouette instead, which MediaPipe
+may not detect; it is meant for smoke runs only. Gestures use synthetic
+landmark trajectories; voice dispatch runs scripted transcripts and a
+synthetic audio clip through a fake recognizer that FLAC-encodes the
+audio like the real one.
+
+Results are compared against benchmarks/baselines.json and the run fails
+if any metric regresses by more than its threshold, or if there is no
+baseline unless --no-baseline is given. Baselines are only meaningful on
+the machine they were recorded on: run once on the release or CI machine
+with --update-baseline and commit the resulting file with the clip.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+from benchmarks.fakes import make_engine
+from benchmarks.replay import ClipSource
+from benchmarks.synthetic import hand_frames, hand_trajectory, labelled_poses, synthetic_wav
+from gesture_classifier import GestureClassifier
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+CLIP_PATH = os.path.join(os.path.dirname(__file__), "clip.mp4")
+
+# Allowed relative regression before a metric fails the run
+DEFAULT_THRESHOLD = 0.20
+THRESHOLDS = {
+    "frame_path_fps": 0.15,
+    "tracked_hand_fraction": 0.10,
+}
+
+# Metrics where larger is better; everything else is a cost
+HIGHER_IS_BETTER = {"frame_path_fps", "tracked_hand_fraction"}
+
+# Frames rendered for the synthetic clip, looped as needed
+SYNTHETIC_CLIP_FRAMES = 90
+
+COMMANDS = [
+    "click", "right click", "double click", "scroll up", "scroll down",
+    "move left", "faster", "slower", "stop",
+    "grid", "5", "back", "cancel",
+    "what time is it",
+]
+
+
+def summarize(name, durations, metrics):
+    durations = np.asarray(durations) * 1000
+    metrics[f"{name}_mean_ms"] = float(durations.mean())
+    metrics[f"{name}_p95_ms"] = float(np.percentile(durations, 95))
+
+
+def bench_frame_path(engine, source, frames, inference):
+    """Per-stage latency and throughput of the camera loop"""
+    stages = ["capture", "flip", "rgb", "inference", "gestures", "preview"]
+    timings = {stage: [] for stage in stages}
+    trajectory = hand_trajectory(frames)
+    state = engine.control.snapshot()
+    pool = engine.frames
+    tracker = engine.hand_tracker
+    inferences, idle_skips, searches = tracker.inferences, tracker.idle_skips, tracker.searches
+    tracked_frames = 0
+
+    started = time.perf_counter()
+    for i in range(frames):
+        t0 = time.perf_counter()
+        captured = pool.read(source)
+        t1 = time.perf_counter()
+        frame = pool.flip(captured)
+        t2 = time.perf_counter()
+        rgb_frame = pool.rgb(frame)
+        t3 = time.perf_counter()
+        if inference:
+            tracked_frames += bool(tracker.process(rgb_frame))
+        t4 = time.perf_counter()
+        hands = [trajectory[i]]
+        gestures = engine.handle_hands(hands, frame.shape)
+        t5 = time.perf_counter()
+        engine.show_preview(frame, hands, gestures, state)
+        t6 = time.perf_counter()
+        engine.bus.drain()
+
+        for stage, duration in zip(stages, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4, t6 - t5)):
+            timings[stage].append(duration)
+    elapsed = time.perf_counter() - started
+
+    metrics = {"frame_path_fps": frames / elapsed}
+    if inference:
+        metrics["tracked_hand_fraction"] = tracked_frames / frames
+        metrics["tracker_inferences_per_frame"] = (tracker.inferences - inferences) / frames
+        metrics["tracker_searches_per_frame"] = (tracker.searches - searches) / frames
+        metrics["tracker_idle_skips_per_frame"] = (tracker.idle_skips - idle_skips) / frames
+    for stage in stages:
+        if stage == "inference" and not inference:
+            continue
+        summarize(f"stage_{stage}", timings[stage], metrics)
+    return metrics
+
+
+def bench_gestures(engine, frames):
+    """Cost of the gesture decision per frame: pinch logic and the classifier"""
+    trajectory = hand_trajectory(frames, seed=1)
+    shape = (720, 1280, 3)
+    durations = []
+    for points in trajectory:
+        started = time.perf_counter()
+        engine.handle_hands([points], shape)
+        durations.append(time.perf_counter() - started)
+        engine.bus.drain()
+
+    hands, labels = labelled_poses()
+    model = GestureClassifier.fit_centroid(hands, labels)
+    predictions = []
+    for points in trajectory:
+        started = time.perf_counter()
+        model.predict(points[np.newaxis])
+        predictions.append(time.perf_counter() - started)
+
+    metrics = {}
+    summarize("gesture_decision", durations, metrics)
+    summarize("gesture_classifier", predictions, metrics)
+    return metrics
+
+
+def bench_dispatch(engine, rounds):
+    """Cost of the voice command chain, without and with audio handling"""
+    durations = []
+    utterances = []
+    with sr.AudioFile(io.BytesIO(synthetic_wav())) as source:
+        audio = sr.Recognizer().record(source)
+
+    # The command chain prints as it goes; keep that out of the terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(rounds):
+            for command in COMMANDS:
+                started = time.perf_counter()
+                engine.handle_command(command)
+                durations.append(time.perf_counter() - started)
+            for _ in COMMANDS:
+                started = time.perf_counter()
+                engine.process_audio(audio)
+                utterances.append(time.perf_counter() - started)
+            engine.bus.drain()
+    engine.motion.stop()
+
+    metrics = {}
+    summarize("command_dispatch", durations, metrics)
+    summarize("utterance_dispatch", utterances, metrics)
+    return metrics
+
+
+def record_clip(path, seconds, camera=0):
+    """Record the benchmark clip from the camera, as captured (not mirrored)"""
+    import cv2
+
+    cap = cv2.VideoCapture(camera)
+    if not cap.isOpened():
+        print("Error: Could not open camera.")
+        return 1
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30
+    writer = None
+    print("Hold one hand still and move the other slowly; press q to stop early")
+    end = time.time() + seconds
+    try:
+        while time.time() < end:
+            ret, frame = cap.read()
+            if not ret:
+                continue
+            if writer is None:
+                height, width = frame.shape[:2]
+                writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+            writer.write(frame)
+            cv2.imshow("Benchmark clip", cv2.flip(frame, 1))
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+    finally:
+        cap.release()
+        if writer is not None:
+            writer.release()
+        cv2.destroyAllWindows()
+    if writer is None:
+        print("No frames recorded.")
+        return 1
+    print(f"Clip written to {path}; commit it with a fresh baseline")
+    return 0
+
+
+def compare(metrics, baseline):
+    """Return a list of (metric, baseline, current, change) that regressed too far"""
+    regressions = []
+    for name, current in metrics.items():
+        if name not in baseline:
+            continue
+        reference = baseline[name]
+        if reference == 0:
+            continue
+        change = (current - reference) / reference
+        if name in HIGHER_IS_BETTER:
+            change = -change
+        if change > THRESHOLDS.get(name, DEFAULT_THRESHOLD):
+            regressions.append((name, reference, current, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", default=CLIP_PATH, help="recorded clip to replay")
+    parser.add_argument("--synthetic", action="store_true", help="replay rendered frames instead of a clip")
+    parser.add_argument("--record-clip", action="store_true", help="record --video from the camera and exit")
+    parser.add_argument("--seconds", type=float, default=10, help="length of a recorded clip")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=50, help="passes over the voice command list")
+    parser.add_argument("--skip-inference", action="store_true", help="leave MediaPipe out of the frame path")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--no-baseline", action="store_true", help="do not fail when there is no baseline")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    if args.record_clip:
+        return record_clip(args.video, args.seconds)
+    if args.synthetic:
+        source = ClipSource(frames=hand_frames(hand_trajectory(min(args.frames, SYNTHETIC_CLIP_FRAMES))))
+    elif os.path.exists(args.video):
+        source = ClipSource(args.video)
+    else:
+        print(f"No clip at {args.video}; record one with --record-clip, or pass --synthetic for a smoke run")
+        return 1
+
+    engine = make_engine(transcripts=COMMANDS)
+    metrics = {}
+    try:
+        metrics.update(bench_frame_path(engine, source, args.frames, not args.skip_inference))
+        metrics.update(bench_gestures(engine, args.frames))
+        metrics.update(bench_dispatch(engine, args.rounds))
+    finally:
+        engine.stop()
+
+    for name, value in metrics.items():
+        print(f"{name:<32} {value:>12.4f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(metrics, f, indent=2)
+
+    if metrics.get("tracked_hand_fraction", 1.0) == 0:
+        print("The tracker never found a hand in the clip, so its follow and idle paths were not measured; "
+              "record a clip with --record-clip")
+        return 1
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"machine": platform.node(), "python": platform.python_version(),
+                       "metrics": metrics}, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline on the reference machine")
+        return 0 if args.no_baseline else 1
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(metrics, baseline["metrics"])
+    for name, reference, current, change in regressions:
+        print(f"REGRESSION {name}: {reference:.4f} -> {current:.4f} ({change:+.1%})")
+    if not regressions:
+        print(f"No regressions against the baseline from {baseline['machine']}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
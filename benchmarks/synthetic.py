@@ -0,0 +1,126 @@
+"""Synthetic hand landmarks, hand frames and audio for the benchmarks."""
+import io
+import math
+import wave
+
+import cv2
+import numpy as np
+
+# Open right hand in normalized image coordinates, wrist at the origin;
+# rows follow MediaPipe's landmark order (wrist, thumb, index, ... pinky)
+OPEN_HAND = np.array([
+    (0.000, 0.000), (-0.060, -0.030), (-0.100, -0.080), (-0.130, -0.120), (-0.160, -0.150),
+    (-0.040, -0.170), (-0.050, -0.240), (-0.055, -0.290), (-0.060, -0.330),
+    (0.000, -0.180), (0.000, -0.260), (0.000, -0.315), (0.000, -0.360),
+    (0.040, -0.170), (0.045, -0.245), (0.050, -0.295), (0.055, -0.335),
+    (0.075, -0.150), (0.090, -0.205), (0.100, -0.245), (0.110, -0.280),
+], dtype=np.float32)
+
+THUMB_TIP_ID = 4
+INDEX_TIP_ID = 8
+
+PALM_IDS = [0, 1, 5, 9, 13, 17]
+FINGER_CHAINS = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16], [17, 18, 19, 20]]
+SKIN_BGR = (120, 160, 215)
+
+
+def hand_pose(center, scale=1.0, pinch=0.0, rng=None, noise=0.002):
+    """One (21, 3) hand with the wrist at center.
+
+    pinch moves the thumb tip towards the index tip: 0 is an open hand,
+    1 has the tips touching.
+    """
+    points = OPEN_HAND * scale
+    points[THUMB_TIP_ID] += (points[INDEX_TIP_ID] - points[THUMB_TIP_ID]) * pinch
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, :2] = points + np.asarray(center, dtype=np.float32)
+    if rng is not None:
+        hand[:, :2] += rng.normal(0, noise, size=(21, 2)).astype(np.float32)
+    return hand
+
+
+def hand_trajectory(frames, pinch_every=45, pinch_frames=10, seed=0):
+    """(frames, 21, 3) landmarks of a hand tracing a Lissajous path.
+
+    Every ``pinch_every`` frames the hand pinches for ``pinch_frames``
+    frames, so a run exercises both cursor movement and clicks.
+    """
+    rng = np.random.default_rng(seed)
+    hands = np.empty((frames, 21, 3), dtype=np.float32)
+    for i in range(frames):
+        t = i / 30.0
+        center = (0.5 + 0.2 * math.sin(1.3 * t), 0.75 + 0.1 * math.sin(2.1 * t))
+        pinch = 1.0 if i % pinch_every < pinch_frames else 0.0
+        hands[i] = hand_pose(center, scale=0.9 + 0.1 * math.sin(t), pinch=pinch, rng=rng)
+    return hands
+
+
+def mirrored(hand):
+    """The same pose as the other hand: mirror x about the wrist"""
+    hand = hand.copy()
+    hand[:, 0] = 2 * hand[0, 0] - hand[:, 0]
+    return hand
+
+
+def render_hand(frame, points, scale=1.0):
+    """Paint a skin-coloured hand silhouette for (21, 3) landmarks onto frame"""
+    height, width = frame.shape[:2]
+    pixels = (points[:, :2] * (width, height)).astype(np.int32)
+    thickness = max(4, int(0.035 * scale * height))
+    cv2.fillConvexPoly(frame, cv2.convexHull(pixels[PALM_IDS]), SKIN_BGR, cv2.LINE_AA)
+    for chain in FINGER_CHAINS:
+        for start, end in zip(chain, chain[1:]):
+            cv2.line(frame, tuple(pixels[start]), tuple(pixels[end]), SKIN_BGR, thickness, cv2.LINE_AA)
+        cv2.circle(frame, tuple(pixels[chain[-1]]), thickness // 2, SKIN_BGR, -1, cv2.LINE_AA)
+    return frame
+
+
+def hand_frames(trajectory, shape=(480, 640, 3), idle_hand=True, seed=0):
+    """Frames showing the trajectory's hand, plus a still second hand if idle_hand.
+
+    The silhouettes are crude, so whether MediaPipe tracks them depends on
+    the model version; the suite reports how many frames had a hand and
+    fails if none did, in which case use a recorded clip via --video.
+    """
+    rng = np.random.default_rng(seed)
+    background = np.full(shape, 70, dtype=np.uint8)
+    background += rng.integers(0, 12, size=shape, dtype=np.uint8)
+    still = mirrored(hand_pose((0.25, 0.8), scale=1.1))
+
+    frames = []
+    for points in trajectory:
+        frame = background.copy()
+        if idle_hand:
+            render_hand(frame, still, 1.1)
+        render_hand(frame, points)
+        frames.append(frame)
+    return frames
+
+
+def labelled_poses(count=200, seed=0):
+    """Open and pinching hands at random places, for fitting a classifier"""
+    rng = np.random.default_rng(seed)
+    hands, labels = [], []
+    for i in range(count):
+        center = rng.uniform((0.3, 0.5), (0.7, 0.9))
+        pinch = i % 2
+        hands.append(hand_pose(center, scale=rng.uniform(0.7, 1.2), pinch=pinch, rng=rng))
+        labels.append("pinch" if pinch else "open")
+    return np.stack(hands), labels
+
+
+def synthetic_wav(seconds=1.0, rate=16000, seed=0):
+    """WAV bytes of a short tone burst over noise, standing in for a spoken phrase"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    envelope = np.clip(np.sin(np.pi * t / seconds), 0, None)
+    signal = 0.4 * envelope * np.sin(2 * np.pi * 220 * t) + 0.02 * rng.normal(size=t.size)
+    samples = (np.clip(signal, -1, 1) * 32767).astype("<i2")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
@@ -0,0 +1,98 @@
+import json
+
+# Settings that can be overridden from a JSON file and reloaded at runtime
+DEFAULT_CONFIG = {
+    "active_region": [0.15, 0.1, 0.85, 0.8],  # part of the frame mapped to the screen
+    "monitor": None,                          # display index, None spans all displays
+    "max_hands": 2,
+    "pointer_hand": "right",                  # hand that moves the pointer; the other one clicks
+    "hand_detect_interval": 15,               # frames between searches for a missing second hand
+    "hand_idle_interval": 5,                  # most frames an unchanged second hand goes without inference
+    "hand_idle_threshold": 4.0,               # mean grey-level change of a hand's crop counted as idle
+    "activation_distance": 50,
+    "click_distance": 30,
+    "smoothing_factor": 0.5,
+    "motion_rate": 60,                        # pointer updates per second for voice motion
+    "motion_min_speed": 150,                  # pixels per second when a motion starts
+    "motion_max_speed": 1500,                 # pixels per second after motion_ramp_time
+    "motion_ramp_time": 1.5,
+    "latency_compensation": True,             # extrapolate the pointer over the measured delay
+    "latency_offset": 0.03,                   # exposure and display delay not seen by timestamps, seconds
+    "prediction_max_horizon": 0.15,           # seconds
+    "prediction_max_offset": 120,             # pixels from the smoothed position
+    "prediction_acceleration": 0.5,           # weight of the acceleration term, 0 for velocity only
+    "scroll_step": 30,
+    "gesture_scroll": True,                   # index and middle finger up scrolls with the hand
+    "scroll_rate": 60,                        # scroll events per second
+    "scroll_gain": 40,                        # scroll units per second for one frame height per second
+    "scroll_friction": 4.0,                   # decay rate of coasting after the pose is released, 1/s
+    "scroll_deadzone": 0.05,                  # hand speed (frame heights per second) treated as still
+    "gesture_model": None,                    # classifier file from fit_gestures.py
+    "gesture_actions": {},                    # classifier label -> action, e.g. {"fist": "right_click"}
+    "gesture_min_confidence": 0.8,
+    "gesture_hold_frames": 5,                 # frames a gesture is held before it fires
+    "voice_feedback": True,                   # spoken confirmations, needs pyttsx3
+    "feedback_rate": 180,                     # words per minute
+    "feedback_volume": 1.0,
+    "feedback_coalesce_window": 2.0,          # seconds a repeated confirmation stays quiet
+    "feedback_barge_in_level": 2.0,           # mic level over the recognizer threshold that interrupts feedback while it plays
+    "screenshot_dir": "screenshots",
+    "screenshot_format": "png",               # png, jpg or bmp
+}
+
+# Types of the settings whose default is None
+OPTIONAL_TYPES = {"monitor": int, "gesture_model": str, "pointer_hand": str}
+# Numeric settings that must be whole numbers
+INTEGER_KEYS = {"max_hands", "hand_detect_interval", "hand_idle_interval", "gesture_hold_frames", "scroll_step"}
+# Settings used as divisors or rates
+POSITIVE_KEYS = {"motion_rate", "scroll_rate", "smoothing_factor", "activation_distance"}
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def check_config(config):
+    """Raise ValueError unless every setting has the type of its default"""
+    invalid = []
+    for key, default in DEFAULT_CONFIG.items():
+        value = config[key]
+        if default is None:
+            valid = value is None or (isinstance(value, OPTIONAL_TYPES[key]) and not isinstance(value, bool))
+        elif isinstance(default, bool):
+            valid = isinstance(value, bool)
+        elif key in INTEGER_KEYS:
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        elif is_number(default):
+            valid = is_number(value) and (key not in POSITIVE_KEYS or value > 0)
+        elif isinstance(default, list):
+            valid = (isinstance(value, (list, tuple)) and len(value) == len(default)
+                     and all(is_number(v) for v in value))
+        elif isinstance(default, dict):
+            valid = isinstance(value, dict) and all(isinstance(v, str) for v in value.values())
+        else:
+            valid = isinstance(value, type(default))
+        if not valid:
+            invalid.append(key)
+    if invalid:
+        raise ValueError(f"Invalid config values: {', '.join(invalid)}")
+
+    left, top, right, bottom = config["active_region"]
+    if not (0.0 <= left < right <= 1.0 and 0.0 <= top < bottom <= 1.0):
+        raise ValueError(f"Invalid active region: {config['active_region']}")
+
+
+def load_config(path=None):
+    """Return the default settings overridden by the JSON file at path"""
+    config = dict(DEFAULT_CONFIG)
+    if path:
+        with open(path) as f:
+            overrides = json.load(f)
+        if not isinstance(overrides, dict):
+            raise ValueError(f"Config file {path} must hold a JSON object")
+        unknown = set(overrides) - set(DEFAULT_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+        config.update(overrides)
+    check_config(config)
+    return config
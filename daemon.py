@@ -0,0 +1,273 @@
+import argparse
+import os
+import selectors
+import signal
+import socket
+import stat
+import sys
+
+import pyautogui
+
+import ipc
+from config import load_config
+from engine import MouseEngine
+from event_bus import ControlChanged, ControlStore, EventBus, LandmarksUpdated
+
+# Drop a client whose unsent backlog grows past this many bytes
+MAX_CLIENT_BACKLOG = 1 << 20
+
+
+class Client:
+    def __init__(self, sock):
+        self.sock = sock
+        self.decoder = ipc.FrameDecoder()
+        self.outbox = bytearray()
+        self.landmarks = False
+
+
+class EventServer:
+    """Unix domain socket server fanning engine events out to local clients.
+
+    Runs on the daemon's main thread; ``poll`` accepts connections, reads
+    control messages and flushes pending output without blocking.
+    """
+
+    def __init__(self, path, on_control):
+        self.path = path
+        self.on_control = on_control
+        self.clients = {}
+        self.selector = selectors.DefaultSelector()
+
+        self.remove_stale_socket(path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Owner-only from the moment the socket exists
+        old_umask = os.umask(0o177)
+        try:
+            self.listener.bind(path)
+        finally:
+            os.umask(old_umask)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+    @staticmethod
+    def remove_stale_socket(path):
+        """Unlink a socket left by a daemon that exited; refuse to take over a live one"""
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f"{path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"Another daemon is already serving {path}")
+
+    def poll(self, timeout):
+        for key, mask in self.selector.select(timeout):
+            if key.fileobj is self.listener:
+                self.accept()
+                continue
+            client = self.clients.get(key.fileobj)
+            if client is None:
+                continue
+            if mask & selectors.EVENT_READ:
+                self.read(client)
+            if mask & selectors.EVENT_WRITE and client.sock in self.clients:
+                self.flush(client)
+
+    def accept(self):
+        sock, _ = self.listener.accept()
+        sock.setblocking(False)
+        self.clients[sock] = Client(sock)
+        self.selector.register(sock, selectors.EVENT_READ)
+
+    def read(self, client):
+        try:
+            data = client.sock.recv(65536)
+            if not data:
+                self.drop(client)
+                return
+            for kind, payload in client.decoder.feed(data):
+                if kind == ipc.MSG_CONTROL:
+                    self.handle_control(client, ipc.decode_payload(kind, payload))
+        except (OSError, ValueError) as e:
+            print(f"Client error: {e}")
+            self.drop(client)
+
+    def handle_control(self, client, message):
+        """Run one control message; a failing handler only affects its client"""
+        try:
+            self.on_control(client, message)
+        except Exception as e:
+            print(f"Control error: {e!r}")
+            if client.sock in self.clients:
+                self.send(client, ipc.encode_json(
+                    ipc.MSG_EVENT, {"type": "error", "message": f"Control message failed: {e}"}))
+
+    def send(self, client, data):
+        client.outbox += data
+        if len(client.outbox) > MAX_CLIENT_BACKLOG:
+            print("Dropping client that is not reading")
+            self.drop(client)
+            return
+        self.flush(client)
+
+    def flush(self, client):
+        try:
+            sent = client.sock.send(client.outbox)
+            del client.outbox[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self.drop(client)
+            return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.outbox else 0)
+        self.selector.modify(client.sock, events)
+
+    def broadcast(self, data):
+        for client in list(self.clients.values()):
+            self.send(client, data)
+
+    def broadcast_landmarks(self, data):
+        # Landmark frames are only worth sending while they are fresh, so a
+        # client that is behind skips them instead of queueing more
+        for client in list(self.clients.values()):
+            if client.landmarks and not client.outbox:
+                self.send(client, data)
+
+    def drop(self, client):
+        if self.clients.pop(client.sock, None) is None:
+            return
+        self.selector.unregister(client.sock)
+        client.sock.close()
+
+    def close(self):
+        for client in list(self.clients.values()):
+            self.drop(client)
+        self.selector.unregister(self.listener)
+        self.listener.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class VirtualMouseDaemon:
+    """Runs the tracking and voice engine without any GUI.
+
+    Gesture, command and state events are published to local clients over
+    a Unix domain socket (see ipc.py for the framing). Clients control the
+    daemon with JSON messages such as {"command": "enable_hand"}.
+    """
+
+    def __init__(self, socket_path, config_path=None, use_tracking_process=False,
+                 hand_active=False, voice_active=False):
+        self.config_path = config_path
+        self.running = False
+
+        self.bus = EventBus()
+        self.control = ControlStore(self.bus)
+        self.engine = MouseEngine(
+            self.bus, self.control, config=load_config(config_path),
+            use_tracking_process=use_tracking_process, preview=False
+        )
+        self.bus.subscribe(None, self.on_event)
+
+        self.server = EventServer(socket_path, self.on_control)
+        self.control.update(hand_active=hand_active, voice_active=voice_active)
+
+    def run(self):
+        self.running = True
+        self.engine.start()
+        try:
+            while self.running:
+                self.server.poll(0.01)
+                self.bus.drain()
+        finally:
+            self.engine.stop()
+            self.server.close()
+
+    def stop(self, *args):
+        self.running = False
+
+    def on_event(self, event):
+        if type(event) is LandmarksUpdated:
+            if not any(c.landmarks for c in self.server.clients.values()):
+                self.engine.publish_landmarks = False
+                return
+            self.server.broadcast_landmarks(ipc.encode_landmarks(event.timestamp, event.hands))
+            return
+        self.server.broadcast(ipc.encode_json(ipc.MSG_EVENT, self.event_to_dict(event)))
+
+    @staticmethod
+    def event_to_dict(event):
+        message = {"type": type(event).__name__}
+        for name, value in event._asdict().items():
+            if type(event) is ControlChanged and name == "state":
+                message.update(value._asdict())
+            else:
+                message[name] = value
+        return message
+
+    def on_control(self, client, message):
+        if not isinstance(message, dict):
+            self.reply(client, "error", message="Control messages must be JSON objects")
+            return
+        command = message.get("command")
+        if command == "enable_hand":
+            self.control.update(hand_active=True)
+        elif command == "disable_hand":
+            self.control.update(hand_active=False)
+        elif command == "enable_voice":
+            self.control.update(voice_active=True)
+        elif command == "disable_voice":
+            self.control.update(voice_active=False)
+        elif command == "landmarks":
+            client.landmarks = bool(message.get("enabled", True))
+            self.engine.publish_landmarks = any(c.landmarks for c in self.server.clients.values())
+        elif command == "reload_config":
+            try:
+                self.engine.apply_config(load_config(self.config_path))
+            except (OSError, ValueError, TypeError) as e:
+                self.reply(client, "error", message=f"Could not reload config: {e}")
+                return
+        elif command == "status":
+            pass
+        else:
+            self.reply(client, "error", message=f"Unknown command: {command}")
+            return
+        self.reply(client, "status", pipeline_delay_ms=round(self.engine.latency.delay * 1000, 1),
+                   **self.control.snapshot()._asdict())
+
+    def reply(self, client, reply_type, **fields):
+        self.server.send(client, ipc.encode_json(ipc.MSG_EVENT, dict(fields, type=reply_type)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless gesture & voice mouse daemon")
+    parser.add_argument("--socket", default=ipc.DEFAULT_SOCKET_PATH,
+                        help="path of the Unix domain socket to serve events on")
+    parser.add_argument("--config", help="JSON file overriding the default settings")
+    parser.add_argument("--tracking-process", action="store_true",
+                        help="run capture and hand inference in a separate process")
+    parser.add_argument("--hand", action="store_true", help="start with hand control enabled")
+    parser.add_argument("--voice", action="store_true", help="start with voice control enabled")
+    args = parser.parse_args()
+
+    pyautogui.FAILSAFE = False
+    try:
+        daemon = VirtualMouseDaemon(
+            args.socket, config_path=args.config,
+            use_tracking_process=args.tracking_process,
+            hand_active=args.hand, voice_active=args.voice
+        )
+    except RuntimeError as e:
+        sys.exit(f"Error: {e}")
+    signal.signal(signal.SIGINT, daemon.stop)
+    signal.signal(signal.SIGTERM, daemon.stop)
+    daemon.run()
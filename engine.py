@@ -0,0 +1,666 @@
+import math
+import threading
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+import pyautogui
+import speech_recognition as sr
+from pynput.mouse import Button, Controller
+
+from config import check_config, load_config
+from frame_buffers import FramePool
+from event_bus import (ErrorRaised, FrameReady, GestureDetected, GridChanged,
+                       LandmarksUpdated, ScreenshotSaved, VoiceCommand)
+from gesture_classifier import GestureClassifier
+from gesture_scroll import InertialScroll, is_scroll_pose
+from grid_nav import GridNavigator, parse_cell
+from hand_tracking import MAX_HANDS, HandTrackingProcess
+from latency_compensation import LatencyCompensator
+from multi_hand import HANDEDNESS, HandTracker, assign_roles
+from screen_geometry import ScreenGeometry
+from screenshot_service import FORMATS, ScreenshotService
+from voice_feedback import (PRIORITY_CONFIRM, PRIORITY_ERROR, PRIORITY_STATUS, BargeInStream,
+                            FeedbackService, MutedBackend, Pyttsx3Backend, pyttsx3_available)
+from voice_motion import CursorMotion
+
+
+class MouseEngine:
+    """Hand tracking and voice command engine, independent of any UI.
+
+    The worker threads read the control flags from ``control`` and report
+    back only through events on ``bus``: recognized commands, gestures,
+    errors, preview frames when ``preview`` is set and raw landmark arrays
+    when ``publish_landmarks`` is set. ``mouse``, ``recognizer``,
+    ``screen`` and ``feedback`` default to the real devices and can be
+    swapped for fakes.
+    """
+
+    def __init__(self, bus, control, config=None, use_tracking_process=False, preview=True,
+                 mouse=None, recognizer=None, screen=None, feedback=None):
+        self.bus = bus
+        self.control = control
+        self.preview = preview
+        self.publish_landmarks = False
+        self.running = False
+        self.last_voice_time = 0
+
+        # Initialize controllers
+        self.mouse = mouse or Controller()
+        self.recognizer = recognizer or sr.Recognizer()
+
+        # MediaPipe setup; with a tracking process the model lives over there
+        self.mp_hands = mp.solutions.hands
+        self.use_tracking_process = use_tracking_process
+        self.tracker = HandTrackingProcess() if use_tracking_process else None
+        self.hand_tracker = None if use_tracking_process else HandTracker()
+        # Set when the tracking process must restart to pick up new options
+        self.tracker_restart = threading.Event()
+
+        # Constants
+        self.GRID_HIDE_TIMEOUT = 0.5
+        self.THUMB_TIP_ID = 4
+        self.INDEX_TIP_ID = 8
+        self.MIDDLE_TIP_ID = 12
+        self.RING_TIP_ID = 16
+        self.PINKY_TIP_ID = 20
+
+        # Actions that classified gestures can be bound to in the config
+        self.actions = {
+            "left_click": lambda: self.mouse.click(Button.left),
+            "right_click": lambda: self.mouse.click(Button.right),
+            "double_click": lambda: self.mouse.click(Button.left, 2),
+            "scroll_up": lambda: self.mouse.scroll(0, self.SCROLL_STEP),
+            "scroll_down": lambda: self.mouse.scroll(0, -self.SCROLL_STEP),
+            "drag": pyautogui.mouseDown,
+            "release": pyautogui.mouseUp,
+            "screenshot": self.take_screenshot,
+        }
+
+        # Cached display layout and hand-to-screen mapping
+        self.screen = screen
+        self.screenshots = None
+        self.motion = None
+        self.scroller = None
+        self.latency = None
+        self.feedback = feedback
+        self.apply_config(config or load_config())
+
+        # Voice grid navigation, only touched by the voice thread. A UI that
+        # shows the grid sets grid_hidden to an Event it sets once the
+        # overlay is gone, so clicks after the grid never land on it.
+        self.grid = GridNavigator()
+        self.grid_hidden = None
+
+        # Reused image buffers, only touched by the tracking thread
+        self.frames = FramePool()
+
+        # Gesture state, only touched by the tracking thread
+        self.prev_x, self.prev_y = 0, 0
+        # Pinch and hold counts are keyed by tracker hand id, so a hand that
+        # drops out never hands its count to the one left
+        self.click_counts = {}
+        self.modifier_counts = {}
+        self.gesture_holds = {}
+        self.active_gestures = set()
+
+    def apply_config(self, config):
+        """Apply tunable settings; safe to call while running.
+
+        Everything is checked before anything changes, so a rejected
+        config raises ValueError (or OSError for an unreadable gesture
+        model) and leaves the engine as it was.
+        """
+        check_config(config)
+        if not 1 <= config["max_hands"] <= MAX_HANDS:
+            raise ValueError(f"max_hands must be between 1 and {MAX_HANDS}")
+        if config["pointer_hand"] is not None and config["pointer_hand"] not in HANDEDNESS:
+            raise ValueError(f"Unknown pointer hand: {config['pointer_hand']}")
+        unknown = set(config["gesture_actions"].values()) - set(self.actions)
+        if unknown:
+            raise ValueError(f"Unknown gesture actions: {', '.join(sorted(unknown))}")
+        if config["screenshot_format"] not in FORMATS:
+            raise ValueError(f"Unsupported screenshot format: {config['screenshot_format']}")
+        try:
+            classifier = GestureClassifier.load(config["gesture_model"]) if config["gesture_model"] else None
+        except KeyError as e:
+            raise ValueError(f"Gesture model {config['gesture_model']} is missing {e}")
+
+        self.config = config
+        self.ACTIVATION_DISTANCE = config["activation_distance"]
+        self.CLICK_DISTANCE = config["click_distance"]
+        self.SMOOTHING_FACTOR = config["smoothing_factor"]
+        self.SCROLL_STEP = config["scroll_step"]
+
+        self.POINTER_HAND = config["pointer_hand"]
+        tracker_options = {
+            "max_hands": config["max_hands"],
+            "pointer_hand": config["pointer_hand"],
+            "detect_interval": config["hand_detect_interval"],
+            "idle_interval": config["hand_idle_interval"],
+            "idle_threshold": config["hand_idle_threshold"],
+        }
+        if self.hand_tracker is not None:
+            for name, value in tracker_options.items():
+                setattr(self.hand_tracker, name, value)
+        elif tracker_options != self.tracker.tracker_options:
+            # The worker builds its tracker on start, so the loop restarts it
+            self.tracker.tracker_options = tracker_options
+            self.tracker_restart.set()
+
+        self.gesture_actions = dict(config["gesture_actions"])
+        self.GESTURE_MIN_CONFIDENCE = config["gesture_min_confidence"]
+        self.GESTURE_HOLD_FRAMES = config["gesture_hold_frames"]
+        self.classifier = classifier
+
+        if self.screen is None:
+            self.screen = ScreenGeometry(config["active_region"], monitor=config["monitor"])
+        else:
+            self.screen.monitor = config["monitor"]
+            self.screen.calibrate(config["active_region"])
+
+        if self.motion is None:
+            self.motion = CursorMotion(self.mouse, self.screen, rate=config["motion_rate"])
+        self.motion.rate = config["motion_rate"]
+        self.motion.min_speed = config["motion_min_speed"]
+        self.motion.max_speed = config["motion_max_speed"]
+        self.motion.ramp_time = config["motion_ramp_time"]
+
+        self.LATENCY_COMPENSATION = config["latency_compensation"]
+        if self.latency is None:
+            self.latency = LatencyCompensator()
+        self.latency.offset = config["latency_offset"]
+        self.latency.max_horizon = config["prediction_max_horizon"]
+        self.latency.max_offset = config["prediction_max_offset"]
+        self.latency.acceleration = config["prediction_acceleration"]
+        self.latency.smoothing = self.SMOOTHING_FACTOR
+
+        self.GESTURE_SCROLL = config["gesture_scroll"]
+        if self.scroller is None:
+            self.scroller = InertialScroll(self.mouse, rate=config["scroll_rate"])
+        self.scroller.rate = config["scroll_rate"]
+        self.scroller.gain = config["scroll_gain"]
+        self.scroller.friction = config["scroll_friction"]
+        self.scroller.deadzone = config["scroll_deadzone"]
+
+        if self.screenshots is None:
+            self.screenshots = ScreenshotService(
+                config["screenshot_dir"], config["screenshot_format"],
+                on_saved=self.on_screenshot_saved, screen=self.screen
+            )
+        else:
+            self.screenshots.directory = config["screenshot_dir"]
+            self.screenshots.image_format = config["screenshot_format"]
+
+        self.VOICE_FEEDBACK = config["voice_feedback"]
+        self.BARGE_IN_LEVEL = config["feedback_barge_in_level"]
+        if self.feedback is None:
+            backend = Pyttsx3Backend() if pyttsx3_available else MutedBackend()
+            self.feedback = FeedbackService(backend)
+        self.feedback.coalesce_window = config["feedback_coalesce_window"]
+        if isinstance(self.feedback.backend, Pyttsx3Backend):
+            self.feedback.backend.rate = config["feedback_rate"]
+            self.feedback.backend.volume = config["feedback_volume"]
+
+    def start(self):
+        self.running = True
+        camera_target = self.tracking_process_loop if self.use_tracking_process else self.camera_loop
+        self.camera_thread = threading.Thread(target=camera_target, daemon=True)
+        self.camera_thread.start()
+
+        self.voice_thread = threading.Thread(target=self.voice_loop, daemon=True)
+        self.voice_thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.use_tracking_process:
+            # Let the loop stop the worker and release the shared memory
+            self.camera_thread.join(timeout=2)
+        self.motion.close()
+        self.scroller.close()
+        self.screenshots.close()
+        self.feedback.close()
+
+    def camera_loop(self):
+        """Capture and hand inference on this thread"""
+        cap = cv2.VideoCapture(0)
+        if not cap.isOpened():
+            self.bus.emit(ErrorRaised, "Error", "Could not open camera")
+            self.confirm("camera not available", PRIORITY_ERROR)
+            return
+
+        while self.running:
+            captured = self.frames.read(cap)
+            if captured is None:
+                continue
+            captured_at = time.perf_counter()
+
+            frame = self.frames.flip(captured)
+            state = self.control.snapshot()
+            hands, roles, ids, fresh = [], [], [], []
+
+            if state.hand_active:
+                rgb_frame = self.frames.rgb(frame)
+                tracked = self.hand_tracker.process(rgb_frame)
+                hands = [hand.points for hand in tracked]
+                roles = assign_roles([hand.handedness for hand in tracked], self.POINTER_HAND)
+                ids = [hand.id for hand in tracked]
+                fresh = [hand.fresh for hand in tracked]
+
+            # The flipped buffer is not needed after inference, so the overlay goes straight on it
+            gestures = self.handle_hands(hands, frame.shape, captured_at, roles, ids, fresh)
+            self.show_preview(frame, hands, gestures, state)
+
+        cap.release()
+
+    def tracking_process_loop(self):
+        """Act on landmark records coming from the hand tracking process"""
+        self.tracker_restart.clear()
+        self.tracker.start()
+        try:
+            while self.running:
+                if self.tracker_restart.is_set():
+                    self.tracker_restart.clear()
+                    self.tracker.stop()
+                    self.tracker.start()
+
+                state = self.control.snapshot()
+                self.tracker.set_inference(state.hand_active)
+
+                record = self.tracker.next_record()
+                if record is None:
+                    continue
+
+                count = record["num_hands"] if state.hand_active else 0
+                hands = list(record["landmarks"][:count])
+                roles = assign_roles(list(record["handedness"][:count]), self.POINTER_HAND)
+                ids = [int(i) for i in record["hand_ids"][:count]]
+                fresh = [bool(f) for f in record["fresh"][:count]]
+                gestures = self.handle_hands(hands, self.tracker.frame_shape, float(record["captured"]),
+                                             roles, ids, fresh)
+
+                # The overlay is drawn on a pooled copy; the shared slot is reused by the worker
+                if state.hand_active and self.preview:
+                    frame = self.tracker.frame(record["frame_seq"])
+                    if frame is not None:
+                        frame = self.frames.overlay(frame)
+                        # Drop the copy if the worker started rewriting the slot meanwhile
+                        if self.tracker.frame_valid(record["frame_seq"]):
+                            self.show_preview(frame, hands, gestures, state)
+        except RuntimeError as e:
+            self.bus.emit(ErrorRaised, "Error", str(e))
+        finally:
+            self.tracker.stop()
+
+    def handle_hands(self, hands, frame_shape, timestamp=None, roles=None, ids=None, fresh=None):
+        """Turn (21, 3) landmark arrays into mouse actions, return the gestures seen.
+
+        timestamp is the perf_counter time the frame was captured. roles
+        gives each hand's role from ``assign_roles``; by default the first
+        hand points and any other modifies. ids are the tracker's stable
+        hand ids (list positions by default). fresh flags hands the tracker
+        saw in this frame (all by default); the others are lost hands at
+        their last position and leave click and gesture counts as they are.
+        """
+        frame_height, frame_width = frame_shape[:2]
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        if roles is None:
+            roles = ["pointer" if i == 0 else "modifier" for i in range(len(hands))]
+        if ids is None:
+            ids = list(range(len(hands)))
+        if fresh is None:
+            fresh = [True] * len(hands)
+        gestures = set()
+        scrolling = False
+
+        if self.publish_landmarks and hands:
+            self.bus.emit(LandmarksUpdated, np.stack(hands))
+
+        for points, role, hand_id, is_fresh in zip(hands, roles, ids, fresh):
+            # Tracking often drops out mid-pinch; frozen landmarks must not complete it
+            if not is_fresh:
+                continue
+
+            # Index and middle finger up scrolls instead of pointing
+            if self.GESTURE_SCROLL and not scrolling and is_scroll_pose(points):
+                finger_y = (points[self.INDEX_TIP_ID, 1] + points[self.MIDDLE_TIP_ID, 1]) / 2
+                self.scroller.track(float(finger_y), timestamp)
+                scrolling = True
+                gestures.add("scroll")
+                continue
+
+            if role == "modifier":
+                self.handle_modifier(points, hand_id, frame_width, frame_height, gestures)
+                continue
+
+            thumb_x = points[self.THUMB_TIP_ID, 0] * frame_width
+            thumb_y = points[self.THUMB_TIP_ID, 1] * frame_height
+            index_x = points[self.INDEX_TIP_ID, 0] * frame_width
+            index_y = points[self.INDEX_TIP_ID, 1] * frame_height
+            distance = math.hypot(thumb_x - index_x, thumb_y - index_y)
+
+            # Click detection
+            if distance < self.CLICK_DISTANCE:
+                count = self.click_counts.get(hand_id, 0) + 1
+                if count > 5:
+                    gestures.add("click")
+                    if count == 6:
+                        self.mouse.click(Button.left)
+            else:
+                count = 0
+            self.click_counts[hand_id] = count
+
+            # Cursor movement
+            if self.ACTIVATION_DISTANCE < distance < 300:
+                screen_x, screen_y = self.screen.map_point(
+                    float(points[self.THUMB_TIP_ID, 0]), float(points[self.THUMB_TIP_ID, 1]))
+
+                smooth_x = self.prev_x + (screen_x - self.prev_x) * self.SMOOTHING_FACTOR
+                smooth_y = self.prev_y + (screen_y - self.prev_y) * self.SMOOTHING_FACTOR
+
+                self.prev_x, self.prev_y = smooth_x, smooth_y
+
+                # Project ahead over the pipeline delay, fading out as the fingers close for a pinch
+                if self.LATENCY_COMPENSATION:
+                    weight = (distance - self.ACTIVATION_DISTANCE) / self.ACTIVATION_DISTANCE
+                    smooth_x, smooth_y = self.screen.clamp(
+                        *self.latency.predict(smooth_x, smooth_y, timestamp, weight))
+
+                self.mouse.position = (smooth_x, smooth_y)
+                gestures.add("move")
+
+        if "move" not in gestures:
+            self.latency.reset()
+        # Counts only carry over while the same hand keeps the same role
+        pointers = {hand_id for hand_id, role in zip(ids, roles) if role == "pointer"}
+        modifiers = {hand_id for hand_id, role in zip(ids, roles) if role == "modifier"}
+        self.click_counts = {key: count for key, count in self.click_counts.items() if key in pointers}
+        self.modifier_counts = {key: count for key, count in self.modifier_counts.items() if key[0] in modifiers}
+
+        # Letting go of the pose leaves the page coasting
+        if not scrolling:
+            self.scroller.release()
+
+        if self.classifier is not None:
+            self.classify_hands(hands, ids, fresh, gestures)
+
+        # Report gestures as they start rather than on every frame
+        for gesture in gestures - self.active_gestures:
+            self.bus.emit(GestureDetected, gesture, (self.prev_x, self.prev_y))
+        self.active_gestures = gestures
+
+        return gestures
+
+    def handle_modifier(self, points, hand_id, frame_width, frame_height, gestures):
+        """Second hand: pinches click at the pointer without moving it"""
+        thumb = points[self.THUMB_TIP_ID, :2] * (frame_width, frame_height)
+        for gesture, finger_id, button in (("click", self.INDEX_TIP_ID, Button.left),
+                                           ("right_click", self.MIDDLE_TIP_ID, Button.right)):
+            finger = points[finger_id, :2] * (frame_width, frame_height)
+            if math.hypot(*(thumb - finger)) < self.CLICK_DISTANCE:
+                count = self.modifier_counts.get((hand_id, gesture), 0) + 1
+                if count > 5:
+                    gestures.add(gesture)
+                    if count == 6:
+                        self.mouse.click(button)
+            else:
+                count = 0
+            self.modifier_counts[hand_id, gesture] = count
+
+    def classify_hands(self, hands, ids, fresh, gestures):
+        """Run the gesture model on all fresh hands at once and fire bound actions"""
+        seen = [i for i in range(len(hands)) if fresh[i]]
+        # Lost hands keep their hold until they are seen again or dropped
+        holds = {hand_id: self.gesture_holds[hand_id] for hand_id, is_fresh in zip(ids, fresh)
+                 if not is_fresh and hand_id in self.gesture_holds}
+        if not seen:
+            self.gesture_holds = holds
+            return
+
+        labels, confidences = self.classifier.predict(np.stack([hands[i] for i in seen]))
+        for i, label, confidence in zip(seen, labels, confidences):
+            if confidence < self.GESTURE_MIN_CONFIDENCE or label not in self.gesture_actions:
+                continue
+            previous, count = self.gesture_holds.get(ids[i], (None, 0))
+            count = count + 1 if previous == label else 1
+            holds[ids[i]] = (label, count)
+
+            # Fire once when the hold threshold is reached, then keep reporting it
+            if count >= self.GESTURE_HOLD_FRAMES:
+                gestures.add(label)
+                if count == self.GESTURE_HOLD_FRAMES:
+                    self.actions[self.gesture_actions[label]]()
+        self.gesture_holds = holds
+
+    def draw_hand(self, frame, points):
+        """Draw landmarks, connections and coloured finger tips"""
+        frame_height, frame_width = frame.shape[:2]
+        pixels = [tuple(p) for p in (points[:, :2] * (frame_width, frame_height)).astype(int).tolist()]
+
+        for start, end in self.mp_hands.HAND_CONNECTIONS:
+            cv2.line(frame, pixels[start], pixels[end], (255, 255, 255), 2)
+        for pixel in pixels:
+            cv2.circle(frame, pixel, 3, (0, 0, 255), -1)
+
+        cv2.circle(frame, pixels[self.THUMB_TIP_ID], 10, (0, 255, 0), -1)   # Green - thumb
+        cv2.circle(frame, pixels[self.INDEX_TIP_ID], 10, (0, 0, 255), -1)   # Red - index
+        cv2.circle(frame, pixels[self.MIDDLE_TIP_ID], 8, (255, 0, 0), -1)   # Blue - middle
+        cv2.circle(frame, pixels[self.RING_TIP_ID], 8, (255, 255, 0), -1)   # Cyan - ring
+        cv2.circle(frame, pixels[self.PINKY_TIP_ID], 8, (255, 0, 255), -1)  # Magenta - pinky
+
+        # Draw line between thumb and index when close
+        thumb, index = pixels[self.THUMB_TIP_ID], pixels[self.INDEX_TIP_ID]
+        if math.hypot(thumb[0] - index[0], thumb[1] - index[1]) < self.CLICK_DISTANCE * 1.5:
+            cv2.line(frame, thumb, index, (0, 255, 255), 2)
+
+    def show_preview(self, frame, hands, gestures, state):
+        """Draw the tracking overlay and publish the frame for the UI"""
+        if not (self.preview and state.hand_active):
+            return
+
+        frame_width = frame.shape[1]
+        for points in hands:
+            self.draw_hand(frame, points)
+        if "click" in gestures:
+            cv2.putText(frame, "CLICK", (50, 50),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        if "move" in gestures:
+            cv2.putText(frame, "MOVING", (50, 100),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+        for row, label in enumerate(sorted(gestures - {"click", "move"})):
+            cv2.putText(frame, label.upper(), (50, 150 + 50 * row),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+
+        # Display mode status
+        mode_text = "HAND MODE" if state.hand_active else "VOICE MODE" if state.voice_active else "IDLE"
+        cv2.putText(frame, mode_text, (frame_width - 200, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+
+        # Tk images are built on the UI thread
+        self.bus.emit(FrameReady, self.frames.preview(frame))
+
+    def take_screenshot(self, target="screen"):
+        """Grab the screen, the active window or the area around the pointer.
+
+        Encoding and saving happen on the screenshot worker, so this returns
+        as soon as the pixels have been grabbed.
+        """
+        if target == "window":
+            self.screenshots.capture_window()
+        elif target == "region":
+            self.screenshots.capture_around(*self.mouse.position)
+        else:
+            self.screenshots.capture()
+
+    def voice_loop(self):
+        while self.running:
+            # Display changes are picked up here, off the tracking thread
+            self.screen.refresh()
+            if not self.control.snapshot().voice_active:
+                time.sleep(0.1)
+                continue
+
+            try:
+                with sr.Microphone() as source:
+                    # Speaking over the feedback cuts it off
+                    stream = BargeInStream(source.stream, self.feedback, self.speech_threshold, self.BARGE_IN_LEVEL)
+                    source.stream = stream
+                    print("Listening...")
+                    audio = self.recognizer.listen(source, timeout=3, phrase_time_limit=3)
+
+                if stream.overheard:
+                    # The microphone picked up the feedback, not the user
+                    print("Ignored audio captured during voice feedback")
+                    continue
+                self.process_audio(audio)
+
+            except Exception as e:
+                print(f"Voice error: {e}")
+
+    def process_audio(self, audio):
+        """Recognize one utterance and execute it"""
+        try:
+            command = self.recognizer.recognize_google(audio).lower()
+            print("Voice command:", command)
+            self.last_voice_time = time.time()
+            self.handle_command(command)
+
+        except sr.UnknownValueError:
+            print("Could not understand audio")
+        except sr.RequestError as e:
+            print(f"Could not request results; {e}")
+            self.confirm("speech service unavailable", PRIORITY_ERROR)
+
+    def speech_threshold(self):
+        """Microphone level that starts a phrase; barge-in needs BARGE_IN_LEVEL times more"""
+        return self.recognizer.energy_threshold
+
+    def confirm(self, text, priority=PRIORITY_CONFIRM):
+        """Queue spoken feedback; never blocks the caller.
+
+        The microphone can hear the feedback, so texts must not contain
+        anything ``handle_command`` matches ("click", "drag", "screenshot"...).
+        """
+        if self.VOICE_FEEDBACK:
+            self.feedback.say(text, priority)
+
+    def on_screenshot_saved(self, path):
+        self.bus.emit(ScreenshotSaved, path)
+        self.confirm("image saved")
+
+    def handle_command(self, command):
+        """Execute a recognized voice command"""
+        self.bus.emit(VoiceCommand, command)
+
+        if "start voice" in command or "begin voice" in command:
+            self.control.update(voice_active=True)
+            self.confirm("voice on", PRIORITY_STATUS)
+        elif "stop voice" in command or "end voice" in command:
+            self.motion.stop()
+            self.scroller.stop()
+            self.close_grid()
+            self.control.update(voice_active=False)
+            self.confirm("voice off", PRIORITY_STATUS)
+        elif self.control.snapshot().voice_active:
+            if self.grid.active and self.handle_grid_command(command):
+                return
+            if self.handle_motion_command(command):
+                return
+            # Anything else interrupts a running motion first
+            self.motion.stop()
+
+            if "click" in command:
+                self.mouse.click(Button.left)
+                self.confirm("pressed")
+            elif "right click" in command:
+                self.mouse.click(Button.right)
+                self.confirm("right pressed")
+            elif "double click" in command:
+                self.mouse.click(Button.left, 2)
+                self.confirm("pressed twice")
+            elif "scroll up" in command:
+                self.mouse.scroll(0, self.SCROLL_STEP)
+                self.confirm("scrolled")
+            elif "scroll down" in command:
+                self.mouse.scroll(0, -self.SCROLL_STEP)
+                self.confirm("scrolled")
+            elif "drag" in command:
+                pyautogui.mouseDown()
+                self.confirm("holding")
+            elif "release" in command:
+                pyautogui.mouseUp()
+                self.confirm("let go")
+            elif "grid" in command:
+                self.open_grid()
+            elif "screenshot" in command:
+                if "window" in command:
+                    self.take_screenshot("window")
+                elif "region" in command:
+                    self.take_screenshot("region")
+                else:
+                    self.take_screenshot()
+            elif "hod" in command:
+                print('Senthil Murugan Sir....')
+
+    def handle_motion_command(self, command):
+        """Start, steer or stop continuous pointer motion; False if not a motion command"""
+        words = command.split()
+        if "move" in words:
+            dx = ("right" in words) - ("left" in words)
+            dy = ("down" in words) - ("up" in words)
+            if dx or dy:
+                self.motion.start(dx, dy)
+                return True
+        elif "faster" in words:
+            self.motion.faster()
+            return True
+        elif "slower" in words:
+            self.motion.slower()
+            return True
+        elif "stop" in words:
+            self.motion.stop()
+            self.scroller.stop()
+            return True
+        return False
+
+    def handle_grid_command(self, command):
+        """Zoom, step back or close the grid; False if not a grid command"""
+        number = parse_cell(command)
+        if number is not None:
+            if self.grid.zoom(number):
+                self.mouse.position = self.grid.center
+                self.bus.emit(GridChanged, self.grid.bounds)
+            return True
+        if "back" in command or "undo" in command:
+            self.grid.back()
+            self.mouse.position = self.grid.center
+            self.bus.emit(GridChanged, self.grid.bounds)
+            return True
+        if "cancel" in command or "close" in command:
+            self.close_grid()
+            return True
+        if "click" in command:
+            # Clicks go through the normal commands but end grid mode first
+            self.close_grid(wait=True)
+        return False
+
+    def open_grid(self):
+        """Show the numbered grid over the display under the pointer"""
+        self.motion.stop()
+        self.screen.refresh()
+        self.grid.start(self.screen.monitor_at(*self.mouse.position))
+        self.mouse.position = self.grid.center
+        self.bus.emit(GridChanged, self.grid.bounds)
+
+    def close_grid(self, wait=False):
+        """End grid mode; with wait, block until the UI has hidden the overlay"""
+        if not self.grid.active:
+            return
+        self.grid.stop()
+        if self.grid_hidden is not None:
+            self.grid_hidden.clear()
+        self.bus.emit(GridChanged, None)
+        if wait and self.grid_hidden is not None:
+            if not self.grid_hidden.wait(self.GRID_HIDE_TIMEOUT):
+                print("Grid overlay was not hidden in time")
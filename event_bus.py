@@ -0,0 +1,135 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+# Immutable snapshot of what the user has switched on
+ControlState = namedtuple("ControlState", ["hand_active", "voice_active"])
+
+# Event types; every event carries the perf_counter time it was emitted at
+ControlChanged = namedtuple("ControlChanged", ["state", "timestamp"])
+FrameReady = namedtuple("FrameReady", ["image", "timestamp"])
+ErrorRaised = namedtuple("ErrorRaised", ["title", "message", "timestamp"])
+VoiceCommand = namedtuple("VoiceCommand", ["command", "timestamp"])
+GestureDetected = namedtuple("GestureDetected", ["gesture", "position", "timestamp"])
+LandmarksUpdated = namedtuple("LandmarksUpdated", ["hands", "timestamp"])
+ScreenshotSaved = namedtuple("ScreenshotSaved", ["path", "timestamp"])
+GridChanged = namedtuple("GridChanged", ["bounds", "timestamp"])  # bounds is None when hidden
+
+
+class EventBus:
+    """Hands events from worker threads to a single consumer thread.
+
+    Any thread may publish; handlers only run inside ``drain``, which the
+    Tk application calls from its own loop through ``attach_tk``. Event
+    types listed in ``COALESCED`` keep only their newest instance, so a
+    slow consumer never builds up a backlog of stale camera frames.
+    """
+
+    COALESCED = (FrameReady,)
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._latest = {}
+        self._handlers = {}
+        self._root = None
+        self._after_id = None
+        self._latency = {}
+
+    def subscribe(self, event_type, handler):
+        """Call handler for every event of event_type, or every event if None"""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def emit(self, event_type, *fields):
+        """Build an event stamped with the current time and publish it"""
+        self.publish(event_type(*fields, time.perf_counter()))
+
+    def publish(self, event):
+        if type(event) in self.COALESCED:
+            self._latest[type(event)] = event
+        else:
+            self._queue.put(event)
+
+    def drain(self, max_events=100):
+        """Deliver pending events on the calling thread, return how many ran"""
+        delivered = 0
+        while delivered < max_events:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(event)
+            delivered += 1
+
+        for event_type in self.COALESCED:
+            event = self._latest.pop(event_type, None)
+            if event is not None:
+                self._deliver(event)
+                delivered += 1
+        return delivered
+
+    def _deliver(self, event):
+        event_type = type(event)
+        stats = self._latency.setdefault(event_type.__name__, [0, 0.0, 0.0])
+        latency = time.perf_counter() - event.timestamp
+        stats[0] += 1
+        stats[1] += latency
+        stats[2] = max(stats[2], latency)
+
+        for handler in self._handlers.get(event_type, []) + self._handlers.get(None, []):
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Event handler error ({event_type.__name__}): {e}")
+
+    def latency_report(self):
+        """Return {event name: (count, mean ms, max ms)} of delivery latency"""
+        return {
+            name: (count, total / count * 1000, worst * 1000)
+            for name, (count, total, worst) in self._latency.items()
+        }
+
+    def attach_tk(self, root, interval_ms=15):
+        """Drain the bus periodically from the Tk main loop"""
+        def tick():
+            self.drain()
+            self._after_id = root.after(interval_ms, tick)
+
+        self._root = root
+        self._after_id = root.after(interval_ms, tick)
+
+    def detach_tk(self):
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+
+class ControlStore:
+    """Control flags shared between threads.
+
+    Readers take ``snapshot()``, a plain attribute read of an immutable
+    ControlState, so they never block. Writers serialize on a lock and
+    publish a ControlChanged event when the state actually changes.
+    """
+
+    def __init__(self, bus, state=None):
+        self.bus = bus
+        self._state = state or ControlState(hand_active=False, voice_active=False)
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        return self._state
+
+    def update(self, **changes):
+        """Set the given fields, return the new state"""
+        return self.modify(lambda state: state._replace(**changes))
+
+    def modify(self, func):
+        """Atomically replace the state with func(state), return the new state"""
+        with self._lock:
+            old = self._state
+            new = func(old)
+            self._state = new
+            if new != old:
+                self.bus.emit(ControlChanged, new)
+        return new
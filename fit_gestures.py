@@ -0,0 +1,151 @@
+import argparse
+import time
+
+import numpy as np
+
+from config import DEFAULT_CONFIG
+from gesture_classifier import GestureClassifier
+
+
+def record(args):
+    """Record landmarks of one gesture from the camera into a session file"""
+    import cv2
+    import mediapipe as mp
+    from hand_tracking import landmarks_to_array
+
+    hands = mp.solutions.hands.Hands(
+        max_num_hands=1,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.7
+    )
+    cap = cv2.VideoCapture(args.camera)
+    if not cap.isOpened():
+        print("Error: Could not open camera.")
+        return
+
+    samples = []
+    start = time.time() + args.delay
+    end = start + args.seconds
+    while time.time() < end:
+        ret, frame = cap.read()
+        if not ret:
+            continue
+        frame = cv2.flip(frame, 1)
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        recording = time.time() >= start
+        if recording and results.multi_hand_landmarks:
+            samples.append(landmarks_to_array(results.multi_hand_landmarks[0]))
+
+        status = f"Recording '{args.label}': {len(samples)}" if recording else "Get ready..."
+        cv2.putText(frame, status, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        cv2.imshow("Gesture Recorder", frame)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            break
+
+    cap.release()
+    cv2.destroyAllWindows()
+    hands.close()
+
+    if not samples:
+        print("No hands recorded.")
+        return
+    np.savez_compressed(args.out, landmarks=np.stack(samples),
+                        labels=np.array([args.label] * len(samples)))
+    print(f"Saved {len(samples)} samples of '{args.label}' to {args.out}")
+
+
+def load_sessions(paths):
+    landmarks, labels = [], []
+    for path in paths:
+        with np.load(path) as data:
+            landmarks.append(data["landmarks"])
+            labels.extend(data["labels"].tolist())
+    return np.concatenate(landmarks), labels
+
+
+def report_confidence(confidence, correct, threshold):
+    """Print confidence percentiles and how many frames would pass the threshold"""
+    p10, p50, p90 = np.percentile(confidence, [10, 50, 90])
+    print(f"Confidence: p10 {p10:.2f}, median {p50:.2f}, p90 {p90:.2f}")
+    passing = confidence >= threshold
+    print(f"  {passing.mean():.1%} of frames reach gesture_min_confidence {threshold:.2f}")
+    if correct.any():
+        print(f"  correct predictions: median {np.median(confidence[correct]):.2f}, "
+              f"{passing[correct].mean():.1%} pass")
+    if not correct.all():
+        print(f"  wrong predictions:   median {np.median(confidence[~correct]):.2f}, "
+              f"{passing[~correct].mean():.1%} pass")
+
+
+def fit(args):
+    """Fit a classifier on recorded sessions and report accuracy and cost"""
+    landmarks, labels = load_sessions(args.sessions)
+    labels = np.array(labels)
+
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(labels))
+    split = int(len(order) * (1 - args.test_fraction))
+    train, test = order[:split], order[split:]
+
+    if args.method == "centroid":
+        model = GestureClassifier.fit_centroid(landmarks[train], labels[train])
+    else:
+        model = GestureClassifier.fit_linear(landmarks[train], labels[train].tolist(), ridge=args.ridge)
+
+    if len(test):
+        temperature = model.calibrate(landmarks[test], labels[test].tolist())
+        print(f"Calibrated temperature {temperature:.4g} on {len(test)} held-out frames")
+
+        predicted, confidence = model.predict(landmarks[test])
+        correct = np.array(predicted) == labels[test]
+        print(f"Accuracy: {correct.mean():.1%} on {len(test)} held-out frames")
+        for label in model.labels:
+            mask = labels[test] == label
+            if mask.any():
+                print(f"  {label:<16} {correct[mask].mean():.1%} ({mask.sum()} frames)")
+        report_confidence(confidence, correct, args.min_confidence)
+    else:
+        # Calibrating on the training frames makes the model overconfident
+        model.calibrate(landmarks[train], labels[train].tolist())
+        print("No held-out frames; accuracy not measured, temperature fitted on training frames")
+
+    # Per-frame cost: one hand per call, as in the tracking loop
+    frame = landmarks[:1]
+    runs = 2000
+    started = time.perf_counter()
+    for _ in range(runs):
+        model.predict(frame)
+    per_frame = (time.perf_counter() - started) / runs
+    print(f"Per-frame cost: {per_frame * 1e6:.1f} us")
+
+    model.save(args.out)
+    print(f"Saved {len(model.labels)}-class model to {args.out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record gestures and fit the gesture classifier")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    record_parser = subparsers.add_parser("record", help="record one gesture from the camera")
+    record_parser.add_argument("label", help="name of the gesture being recorded")
+    record_parser.add_argument("--out", required=True, help="session file to write (.npz)")
+    record_parser.add_argument("--seconds", type=float, default=10)
+    record_parser.add_argument("--delay", type=float, default=3, help="countdown before recording")
+    record_parser.add_argument("--camera", type=int, default=0)
+
+    fit_parser = subparsers.add_parser("fit", help="fit a model from recorded sessions")
+    fit_parser.add_argument("sessions", nargs="+", help="session files from 'record'")
+    fit_parser.add_argument("--out", default="gestures.npz", help="model file to write")
+    fit_parser.add_argument("--method", choices=["linear", "centroid"], default="linear")
+    fit_parser.add_argument("--ridge", type=float, default=1e-2)
+    fit_parser.add_argument("--test-fraction", type=float, default=0.2)
+    fit_parser.add_argument("--seed", type=int, default=0)
+    fit_parser.add_argument("--min-confidence", type=float, default=DEFAULT_CONFIG["gesture_min_confidence"],
+                            help="threshold to report the pass rate against")
+
+    args = parser.parse_args()
+    if args.action == "record":
+        record(args)
+    else:
+        fit(args)
@@ -0,0 +1,68 @@
+import cv2
+import numpy as np
+
+
+class FramePool:
+    """Preallocated destination buffers for the per-frame image path.
+
+    Every method writes into a buffer owned by the pool and returns it, so
+    once the first frame has been seen the capture, flip, colour
+    conversion, overlay and preview steps allocate nothing. Buffers are
+    only replaced when the frame size changes; ``allocations`` counts how
+    often that happened. Previews rotate through ``preview_slots`` buffers
+    so the UI thread can still read the last one while the next is built.
+    """
+
+    def __init__(self, preview_size=(640, 480), preview_slots=3):
+        self.preview_size = preview_size
+        self.preview_slots = preview_slots
+        self.allocations = 0
+        self._buffers = {}
+        self._preview_index = 0
+
+    def buffer(self, name, shape):
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            self._buffers[name] = buf
+            self.allocations += 1
+        return buf
+
+    def read(self, cap):
+        """Read the next camera frame into the capture buffer; None on failure"""
+        ret, frame = cap.read(self._buffers.get("capture"))
+        if not ret:
+            return None
+        if self._buffers.get("capture") is not frame:
+            # First frame, or the camera changed resolution
+            self._buffers["capture"] = frame
+            self.allocations += 1
+        return frame
+
+    def flip(self, frame):
+        """Mirror frame horizontally"""
+        dst = self.buffer("flipped", frame.shape)
+        cv2.flip(frame, 1, dst=dst)
+        return dst
+
+    def rgb(self, frame):
+        dst = self.buffer("rgb", frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=dst)
+        return dst
+
+    def overlay(self, frame):
+        """Copy of frame that can be drawn on without touching the source"""
+        dst = self.buffer("overlay", frame.shape)
+        np.copyto(dst, frame)
+        return dst
+
+    def preview(self, frame):
+        """Scaled RGB preview of a BGR frame"""
+        width, height = self.preview_size
+        small = self.buffer("preview_bgr", (height, width, 3))
+        cv2.resize(frame, (width, height), dst=small)
+
+        self._preview_index = (self._preview_index + 1) % self.preview_slots
+        dst = self.buffer(f"preview_{self._preview_index}", (height, width, 3))
+        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=dst)
+        return dst
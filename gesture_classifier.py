@@ -0,0 +1,116 @@
+import numpy as np
+
+WRIST_ID = 0
+MIDDLE_MCP_ID = 9
+
+# Bumped whenever the feature layout changes so stale models are rejected
+FEATURE_VERSION = 1
+
+
+def landmark_features(hands):
+    """Turn (N, 21, 3) landmarks into (N, 64) scale- and position-invariant features.
+
+    Points are taken relative to the wrist and divided by the wrist to
+    middle-knuckle distance, so the same pose gives the same vector
+    anywhere in the frame and at any distance from the camera. A constant
+    1 is appended as the bias input.
+    """
+    hands = np.asarray(hands, dtype=np.float32)
+    if hands.ndim == 2:
+        hands = hands[np.newaxis]
+    centered = hands - hands[:, WRIST_ID:WRIST_ID + 1, :]
+    scale = np.linalg.norm(centered[:, MIDDLE_MCP_ID, :2], axis=1)
+    scale = np.maximum(scale, 1e-6)[:, np.newaxis, np.newaxis]
+    features = (centered / scale).reshape(len(hands), -1)
+    return np.hstack([features, np.ones((len(hands), 1), dtype=np.float32)])
+
+
+class GestureClassifier:
+    """Linear scorer over landmark features: one matrix product per frame.
+
+    Both fitting methods produce a weight matrix of shape (64, classes):
+    ``fit_linear`` solves a ridge regression onto one-hot labels, and
+    ``fit_centroid`` encodes nearest-centroid matching, since
+    argmin |x - c|^2 equals argmax (2 x.c - |c|^2).
+
+    Raw scores are not probabilities: ridge outputs sit near one-hot, which
+    caps a plain softmax at 0.73 for two classes. ``calibrate`` fits a
+    softmax temperature on held-out frames so confidences can be compared
+    against ``gesture_min_confidence``.
+    """
+
+    # Temperatures searched by calibrate, log-spaced
+    TEMPERATURES = np.geomspace(1e-3, 1e2, 256)
+
+    def __init__(self, weights, labels, temperature=1.0):
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.labels = list(labels)
+        self.temperature = float(temperature)
+        if self.weights.shape[1] != len(self.labels):
+            raise ValueError("Weights and labels do not match")
+
+    @classmethod
+    def fit_linear(cls, hands, labels, ridge=1e-2):
+        features = landmark_features(hands).astype(np.float64)
+        classes = sorted(set(labels))
+        targets = np.zeros((len(labels), len(classes)))
+        targets[np.arange(len(labels)), [classes.index(label) for label in labels]] = 1.0
+        gram = features.T @ features + ridge * np.eye(features.shape[1])
+        weights = np.linalg.solve(gram, features.T @ targets)
+        return cls(weights, classes)
+
+    @classmethod
+    def fit_centroid(cls, hands, labels):
+        features = landmark_features(hands)[:, :-1].astype(np.float64)
+        labels = np.asarray(labels)
+        classes = sorted(set(labels.tolist()))
+        centroids = np.stack([features[labels == label].mean(axis=0) for label in classes])
+        weights = np.vstack([2 * centroids.T, -np.sum(centroids ** 2, axis=1)])
+        return cls(weights, classes)
+
+    def scores(self, hands):
+        return landmark_features(hands) @ self.weights
+
+    @staticmethod
+    def probabilities(scores, temperature):
+        shifted = scores / temperature
+        shifted = np.exp(shifted - shifted.max(axis=1, keepdims=True))
+        return shifted / shifted.sum(axis=1, keepdims=True)
+
+    def calibrate(self, hands, labels):
+        """Pick the temperature with the lowest log loss on (ideally held-out) frames"""
+        # Classes missing from training cannot be scored
+        known = np.array([label in self.labels for label in labels], dtype=bool)
+        scores = self.scores(np.asarray(hands)[known]).astype(np.float64)
+        targets = np.array([self.labels.index(label) for label, k in zip(labels, known) if k])
+        rows = np.arange(len(targets))
+        losses = [
+            -np.log(np.maximum(self.probabilities(scores, t)[rows, targets], 1e-12)).mean()
+            for t in self.TEMPERATURES
+        ]
+        self.temperature = float(self.TEMPERATURES[int(np.argmin(losses))])
+        return self.temperature
+
+    def predict(self, hands):
+        """Return (labels, confidences) for a stack of hands.
+
+        Confidence is the calibrated softmax probability of the winning class.
+        """
+        scores = self.scores(hands)
+        best = scores.argmax(axis=1)
+        shifted = np.exp((scores - scores[np.arange(len(best)), best][:, np.newaxis]) / self.temperature)
+        confidence = 1.0 / shifted.sum(axis=1)
+        return [self.labels[i] for i in best], confidence
+
+    def save(self, path):
+        np.savez_compressed(path, weights=self.weights, labels=np.array(self.labels),
+                            temperature=self.temperature, version=FEATURE_VERSION)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if int(data["version"]) != FEATURE_VERSION:
+                raise ValueError(f"Gesture model {path} uses an old feature layout")
+            if "temperature" not in data:
+                raise ValueError(f"Gesture model {path} is not calibrated; fit it again")
+            return cls(data["weights"], data["labels"].tolist(), float(data["temperature"]))
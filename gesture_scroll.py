@@ -0,0 +1,139 @@
+import math
+import threading
+import time
+
+import numpy as np
+
+from ticker import Ticker
+
+WRIST_ID = 0
+# (tip, pip) landmark ids of the index, middle, ring and pinky fingers
+FINGER_JOINTS = ((8, 6), (12, 10), (16, 14), (20, 18))
+
+
+def extended_fingers(points):
+    """Extended state of index, middle, ring and pinky for one (21, 3) hand.
+
+    A finger counts as extended when its tip is further from the wrist
+    than its middle joint, which holds for any hand rotation in the image.
+    """
+    xy = points[:, :2]
+    wrist = xy[WRIST_ID]
+    return tuple(
+        bool(np.linalg.norm(xy[tip] - wrist) > np.linalg.norm(xy[pip] - wrist))
+        for tip, pip in FINGER_JOINTS
+    )
+
+
+def is_scroll_pose(points):
+    """Index and middle finger extended, ring and pinky folded"""
+    return extended_fingers(points) == (True, True, False, False)
+
+
+class InertialScroll:
+    """Continuous scrolling driven by hand velocity, emitted from a timer thread.
+
+    While the scroll pose is held, ``track`` is fed the hand's vertical
+    position (normalized image coordinates) and the scroll velocity follows
+    the hand's smoothed vertical velocity times ``gain`` (scroll units per
+    frame height). After ``release`` the velocity carries on and decays
+    with ``friction`` (per second) until it falls below ``MIN_VELOCITY``.
+    The timer thread emits scroll events at ``rate`` per second whatever the
+    camera frame rate, carrying fractional units between ticks, and sleeps
+    while the velocity is zero.
+    """
+
+    # Time constant of the velocity smoothing, seconds
+    VELOCITY_SMOOTHING = 0.05
+    # Scroll units per second below which coasting stops
+    MIN_VELOCITY = 0.5
+    MAX_VELOCITY = 400.0
+    # Gaps between samples longer than this restart velocity tracking
+    MAX_SAMPLE_GAP = 0.25
+
+    def __init__(self, mouse, rate=60, gain=40.0, friction=4.0, deadzone=0.05):
+        self.mouse = mouse
+        self.gain = gain
+        self.friction = friction
+        self.deadzone = deadzone
+
+        self._lock = threading.Lock()
+        self._tracking = False
+        self._last_sample = None
+        self._hand_velocity = 0.0
+        self._velocity = 0.0
+        self._remainder = 0.0
+        self._ticker = Ticker(self._tick, lambda: self.active, rate, begin=self._begin)
+
+    @property
+    def rate(self):
+        """Scroll events per second"""
+        return self._ticker.rate
+
+    @rate.setter
+    def rate(self, rate):
+        self._ticker.rate = rate
+
+    @property
+    def active(self):
+        return self._velocity != 0.0
+
+    def track(self, y, timestamp):
+        """Feed the hand's vertical position while the scroll pose is held"""
+        with self._lock:
+            self._tracking = True
+
+            last = self._last_sample
+            self._last_sample = (y, timestamp)
+            if last is None or not 0 < timestamp - last[1] < self.MAX_SAMPLE_GAP:
+                # Grabbing the page again stops any coasting
+                self._hand_velocity = 0.0
+                self._velocity = 0.0
+                return
+
+            dt = timestamp - last[1]
+            alpha = 1.0 - math.exp(-dt / self.VELOCITY_SMOOTHING)
+            self._hand_velocity += ((y - last[0]) / dt - self._hand_velocity) * alpha
+
+            # Image y grows downwards; moving the hand up scrolls up
+            velocity = 0.0 if abs(self._hand_velocity) < self.deadzone else -self._hand_velocity * self.gain
+            self._velocity = max(-self.MAX_VELOCITY, min(self.MAX_VELOCITY, velocity))
+        self._ticker.wake()
+
+    def release(self):
+        """The hand left the scroll pose; keep scrolling under friction"""
+        with self._lock:
+            self._tracking = False
+            self._last_sample = None
+
+    def stop(self):
+        """Stop scrolling at once, including any coasting"""
+        with self._lock:
+            self._tracking = False
+            self._last_sample = None
+            self._velocity = 0.0
+
+    def _begin(self):
+        self._remainder = 0.0
+
+    def _tick(self, dt):
+        with self._lock:
+            if not self._tracking:
+                self._velocity *= math.exp(-self.friction * dt)
+                if abs(self._velocity) < self.MIN_VELOCITY:
+                    self._velocity = 0.0
+            velocity = self._velocity
+        if velocity == 0.0:
+            return False
+
+        # Fractional units carry over to the next tick
+        self._remainder += velocity * dt
+        steps = int(self._remainder)
+        if steps:
+            self.mouse.scroll(0, steps)
+            self._remainder -= steps
+        return True
+
+    def close(self):
+        self._ticker.close()
+        self.stop()
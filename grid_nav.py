@@ -0,0 +1,81 @@
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9,
+}
+
+# What the recognizer tends to return for a lone spoken number
+HOMOPHONES = {"won": 1, "to": 2, "too": 2, "for": 4, "ate": 8}
+
+
+def parse_cell(command):
+    """Return the cell number 1-9 spoken in command, or None"""
+    words = command.split()
+    if len(words) == 1 and words[0] in HOMOPHONES:
+        return HOMOPHONES[words[0]]
+    for word in words:
+        if word.isdigit() and 1 <= int(word) <= 9:
+            return int(word)
+    for word in words:
+        if word in NUMBER_WORDS:
+            return NUMBER_WORDS[word]
+    return None
+
+
+class GridNavigator:
+    """Recursive 3x3 subdivision of a screen rectangle.
+
+    Cells are numbered 1-9 left to right, top to bottom, like a phone
+    keypad. Each ``zoom`` narrows the area to one cell, so any pixel of a
+    W x H display is reachable in about log9(W * H) steps.
+    """
+
+    ROWS = 3
+    COLS = 3
+
+    def __init__(self, min_size=1):
+        self.min_size = min_size
+        self.bounds = None
+        self._history = []
+
+    @property
+    def active(self):
+        return self.bounds is not None
+
+    def start(self, bounds):
+        """Begin navigating inside (x, y, width, height)"""
+        self.bounds = tuple(bounds)
+        self._history = []
+
+    def stop(self):
+        self.bounds = None
+        self._history = []
+
+    def cell(self, number):
+        """Rectangle of cell number 1-9 within the current bounds"""
+        x, y, width, height = self.bounds
+        row, col = divmod(number - 1, self.COLS)
+        left = x + width * col // self.COLS
+        top = y + height * row // self.ROWS
+        right = x + width * (col + 1) // self.COLS
+        bottom = y + height * (row + 1) // self.ROWS
+        return (left, top, right - left, bottom - top)
+
+    def zoom(self, number):
+        """Narrow to cell number; returns False once cells get too small to split"""
+        if not self.active or not 1 <= number <= 9:
+            return False
+        cell = self.cell(number)
+        if cell[2] < self.min_size or cell[3] < self.min_size:
+            return False
+        self._history.append(self.bounds)
+        self.bounds = cell
+        return True
+
+    def back(self):
+        if self._history:
+            self.bounds = self._history.pop()
+
+    @property
+    def center(self):
+        x, y, width, height = self.bounds
+        return (x + width // 2, y + height // 2)
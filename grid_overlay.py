@@ -0,0 +1,52 @@
+import tkinter as tk
+
+
+class GridOverlay:
+    """Borderless, translucent, always-on-top window showing the numbered grid.
+
+    The window is created once and only moved, redrawn or withdrawn as the
+    grid changes, so each voice step costs a handful of canvas items.
+    """
+
+    def __init__(self, root, rows=3, cols=3, alpha=0.35):
+        self.rows = rows
+        self.cols = cols
+        self.window = tk.Toplevel(root)
+        self.window.overrideredirect(True)
+        self.window.attributes("-topmost", True)
+        self.window.attributes("-alpha", alpha)
+        self.window.withdraw()
+
+        self.canvas = tk.Canvas(self.window, bg="black", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+    def show(self, bounds):
+        x, y, width, height = bounds
+        self.window.geometry(f"{max(width, 1)}x{max(height, 1)}+{x}+{y}")
+        self.canvas.delete("all")
+
+        for col in range(1, self.cols):
+            left = width * col // self.cols
+            self.canvas.create_line(left, 0, left, height, fill="yellow", width=2)
+        for row in range(1, self.rows):
+            top = height * row // self.rows
+            self.canvas.create_line(0, top, width, top, fill="yellow", width=2)
+
+        # Labels shrink with the cells and disappear when they no longer fit
+        font_size = min(width // self.cols, height // self.rows) // 3
+        if font_size >= 6:
+            for number in range(1, self.rows * self.cols + 1):
+                row, col = divmod(number - 1, self.cols)
+                cx = width * (2 * col + 1) // (2 * self.cols)
+                cy = height * (2 * row + 1) // (2 * self.rows)
+                self.canvas.create_text(cx, cy, text=str(number), fill="white",
+                                        font=("Helvetica", min(font_size, 72), "bold"))
+
+        self.window.deiconify()
+        self.window.lift()
+
+    def hide(self):
+        self.window.withdraw()
+
+    def destroy(self):
+        self.window.destroy()
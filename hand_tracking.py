@@ -0,0 +1,261 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+MAX_HANDS = 2
+
+# One tracking result; fixed size so it can live in a shared-memory slot
+RECORD_DTYPE = np.dtype([
+    ("frame_seq", np.int64),
+    ("captured", np.float64),
+    ("processed", np.float64),
+    ("num_hands", np.int32),
+    ("handedness", np.int8, (MAX_HANDS,)),
+    ("hand_ids", np.int32, (MAX_HANDS,)),
+    ("fresh", np.bool_, (MAX_HANDS,)),
+    ("landmarks", np.float32, (MAX_HANDS, NUM_LANDMARKS, 3)),
+])
+
+
+def landmarks_to_array(hand_landmarks, out=None):
+    """Copy a MediaPipe landmark list into a (21, 3) float32 array"""
+    if out is None:
+        out = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    for i, lm in enumerate(hand_landmarks.landmark):
+        out[i, 0] = lm.x
+        out[i, 1] = lm.y
+        out[i, 2] = lm.z
+    return out
+
+
+class SharedRing:
+    """Ring of equally shaped arrays in a shared-memory segment.
+
+    The segment starts with an int64 header: the last committed sequence
+    number followed by the sequence number stored in each slot. Sequence
+    numbers start at 1; a reader can check ``valid(seq)`` after using a
+    slot to make sure the writer has not lapped it in the meantime. The
+    writer marks a slot invalid in ``next_slot``, before touching its data,
+    so a copy taken while the slot is rewritten fails that check.
+    """
+
+    # Slot header value while the slot is being written
+    WRITING = -1
+
+    def __init__(self, shm, shape, dtype, slots, owner):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = slots
+        self.owner = owner
+        self.header = np.ndarray((slots + 1,), dtype=np.int64, buffer=shm.buf)
+        self.data = np.ndarray(
+            (slots,) + self.shape, dtype=self.dtype, buffer=shm.buf,
+            offset=self.header.nbytes
+        )
+
+    @classmethod
+    def create(cls, shape, dtype, slots=4):
+        size = (slots + 1) * 8 + slots * int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        ring = cls(shm, shape, dtype, slots, owner=True)
+        ring.header[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name, shape, dtype, slots=4):
+        shm = shared_memory.SharedMemory(name=name)
+        # Only the creating process may unlink the segment (bpo-39959)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return cls(shm, shape, dtype, slots, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def latest_seq(self):
+        return int(self.header[0])
+
+    def next_slot(self):
+        """Return (seq, view) of the slot to be written next"""
+        seq = self.latest_seq + 1
+        self.header[1 + seq % self.slots] = self.WRITING
+        return seq, self.data[seq % self.slots, ...]
+
+    def commit(self, seq):
+        self.header[1 + seq % self.slots] = seq
+        self.header[0] = seq
+
+    def get(self, seq):
+        """Zero-copy view of slot seq, or None if it has been overwritten"""
+        if seq <= 0 or not self.valid(seq):
+            return None
+        return self.data[seq % self.slots, ...]
+
+    def valid(self, seq):
+        return self.header[1 + seq % self.slots] == seq
+
+    def close(self):
+        # Views into the buffer must go before the segment can be closed
+        self.header = None
+        self.data = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def run_tracking_worker(frame_name, record_name, frame_shape, slots, camera_index,
+                        tracker_options, inference_enabled, stop_event, conn):
+    """Capture and hand inference loop of the tracking process"""
+    import cv2
+
+    from multi_hand import HandTracker
+
+    frames = SharedRing.attach(frame_name, frame_shape, np.uint8, slots)
+    records = SharedRing.attach(record_name, (), RECORD_DTYPE, slots)
+
+    tracker = HandTracker(**tracker_options)
+    frame_height, frame_width = frame_shape[:2]
+    cap = cv2.VideoCapture(camera_index)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, frame_width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, frame_height)
+
+    capture = np.empty(frame_shape, dtype=np.uint8)
+    rgb_frame = np.empty(frame_shape, dtype=np.uint8)
+
+    try:
+        if not cap.isOpened():
+            conn.send(("error", "Could not open camera"))
+            return
+
+        while not stop_event.is_set():
+            ret, captured = cap.read(capture)
+            if not ret:
+                continue
+            captured_at = time.perf_counter()
+
+            # Mirror straight into the shared slot the UI previews from
+            frame_seq, slot = frames.next_slot()
+            if captured.shape != slot.shape:
+                captured = cv2.resize(captured, (frame_width, frame_height))
+            cv2.flip(captured, 1, dst=slot)
+            frames.commit(frame_seq)
+
+            record_seq, record = records.next_slot()
+            record["frame_seq"] = frame_seq
+            record["captured"] = captured_at
+            record["num_hands"] = 0
+
+            if inference_enabled.value:
+                cv2.cvtColor(slot, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+                tracked = tracker.process(rgb_frame)[:MAX_HANDS]
+                for i, hand in enumerate(tracked):
+                    record["landmarks"][i] = hand.points
+                    record["handedness"][i] = hand.handedness
+                    record["hand_ids"][i] = hand.id
+                    record["fresh"][i] = hand.fresh
+                record["num_hands"] = len(tracked)
+
+            record["processed"] = time.perf_counter()
+            records.commit(record_seq)
+            conn.send(record_seq)
+    finally:
+        cap.release()
+        tracker.close()
+        frames.close()
+        records.close()
+
+
+class HandTrackingProcess:
+    """Runs capture and hand inference in a separate process.
+
+    Frames and landmark records are exchanged through shared-memory rings
+    owned by this side; the only thing sent over the pipe is the sequence
+    number of each new record. Camera frames are never copied unless the
+    caller does so for a preview. ``tracker_options`` are passed to the
+    worker's HandTracker when the process starts.
+    """
+
+    def __init__(self, frame_shape=(480, 640, 3), slots=4, camera_index=0, tracker_options=None):
+        self.frame_shape = tuple(frame_shape)
+        self.slots = slots
+        self.camera_index = camera_index
+        self.tracker_options = dict(tracker_options or {})
+        self.frames = None
+        self.records = None
+        self.process = None
+
+    def start(self):
+        self.frames = SharedRing.create(self.frame_shape, np.uint8, self.slots)
+        self.records = SharedRing.create((), RECORD_DTYPE, self.slots)
+        self.inference_enabled = multiprocessing.Value("b", 0, lock=False)
+        self.stop_event = multiprocessing.Event()
+        self.conn, child_conn = multiprocessing.Pipe(duplex=False)
+
+        self.process = multiprocessing.Process(
+            target=run_tracking_worker,
+            args=(self.frames.name, self.records.name, self.frame_shape, self.slots,
+                  self.camera_index, self.tracker_options, self.inference_enabled,
+                  self.stop_event, child_conn),
+            daemon=True
+        )
+        self.process.start()
+
+    def set_inference(self, enabled):
+        self.inference_enabled.value = 1 if enabled else 0
+
+    def next_record(self, timeout=0.1):
+        """Wait for a new tracking record and return a copy of the newest one.
+
+        Returns None on timeout. Raises RuntimeError if the worker reported
+        an error or exited.
+        """
+        if not self.conn.poll(timeout):
+            if not self.process.is_alive():
+                raise RuntimeError("Hand tracking process exited")
+            return None
+
+        seq = None
+        try:
+            while self.conn.poll():
+                message = self.conn.recv()
+                if isinstance(message, tuple):
+                    raise RuntimeError(message[1])
+                seq = message
+        except EOFError:
+            raise RuntimeError("Hand tracking process exited")
+
+        record = self.records.get(seq)
+        if record is None:
+            return None
+        record = record.copy()
+        if not self.records.valid(seq):
+            return None
+        return record
+
+    def frame(self, frame_seq):
+        """Zero-copy view of a shared frame, or None if it was overwritten"""
+        return self.frames.get(int(frame_seq))
+
+    def frame_valid(self, frame_seq):
+        """Whether a frame taken with ``frame`` is still intact, e.g. after copying it"""
+        return self.frames.valid(int(frame_seq))
+
+    def stop(self):
+        if self.process is None:
+            return
+        self.stop_event.set()
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
+        self.frames.close()
+        self.records.close()
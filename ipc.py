@@ -0,0 +1,90 @@
+import json
+import socket
+import struct
+
+import numpy as np
+
+# Every message is framed as: payload length (uint32), message type (uint8), payload
+HEADER = struct.Struct("!IB")
+MAX_PAYLOAD = 1 << 20
+
+MSG_EVENT = 1      # JSON object, daemon -> client
+MSG_LANDMARKS = 2  # binary landmark frame, daemon -> client
+MSG_CONTROL = 3    # JSON object, client -> daemon
+
+# Landmark payload: timestamp, hand count, then float32 (hands, 21, 3)
+LANDMARK_HEADER = struct.Struct("<dB")
+
+DEFAULT_SOCKET_PATH = "/tmp/virtual-mouse.sock"
+
+
+def encode_message(kind, payload):
+    return HEADER.pack(len(payload), kind) + payload
+
+
+def encode_json(kind, obj):
+    return encode_message(kind, json.dumps(obj, separators=(",", ":")).encode())
+
+
+def encode_landmarks(timestamp, hands):
+    hands = np.ascontiguousarray(hands, dtype=np.float32)
+    return encode_message(MSG_LANDMARKS, LANDMARK_HEADER.pack(timestamp, len(hands)) + hands.tobytes())
+
+
+def decode_landmarks(payload):
+    """Return (timestamp, float32 array of shape (hands, 21, 3))"""
+    timestamp, count = LANDMARK_HEADER.unpack_from(payload)
+    hands = np.frombuffer(payload, dtype=np.float32, offset=LANDMARK_HEADER.size)
+    return timestamp, hands.reshape(count, 21, 3)
+
+
+def decode_payload(kind, payload):
+    if kind == MSG_LANDMARKS:
+        return decode_landmarks(payload)
+    return json.loads(payload)
+
+
+class FrameDecoder:
+    """Reassembles framed messages from a byte stream"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Add received bytes, return the list of complete (type, payload) messages"""
+        self._buffer += data
+        messages = []
+        while len(self._buffer) >= HEADER.size:
+            length, kind = HEADER.unpack_from(self._buffer)
+            if length > MAX_PAYLOAD:
+                raise ValueError(f"Message too large: {length} bytes")
+            end = HEADER.size + length
+            if len(self._buffer) < end:
+                break
+            messages.append((kind, bytes(self._buffer[HEADER.size:end])))
+            del self._buffer[:end]
+        return messages
+
+
+class DaemonClient:
+    """Minimal client for the headless daemon's event stream"""
+
+    def __init__(self, path=DEFAULT_SOCKET_PATH):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.decoder = FrameDecoder()
+
+    def send_control(self, command, **fields):
+        self.sock.sendall(encode_json(MSG_CONTROL, dict(fields, command=command)))
+
+    def messages(self):
+        """Yield (type, decoded payload) until the daemon closes the connection"""
+        while True:
+            data = self.sock.recv(65536)
+            if not data:
+                return
+            for kind, payload in self.decoder.feed(data):
+                yield kind, decode_payload(kind, payload)
+
+    def close(self):
+        self.sock.close()
@@ -0,0 +1,86 @@
+import math
+import time
+
+
+class LatencyCompensator:
+    """Extrapolates the smoothed cursor position over the pipeline delay.
+
+    ``predict`` is called once per frame with the smoothed screen position
+    and the frame's capture timestamp. The delay from capture to actuation
+    is measured on every call and averaged; added to it are ``offset`` for
+    the exposure and display time the timestamps cannot see and the lag of
+    the exponential smoothing itself (``smoothing`` is its factor). The
+    position is then extrapolated over that horizon with a constant
+    acceleration model, ``acceleration`` weighting the second-order term.
+
+    Predictions are limited to ``max_horizon`` seconds ahead and
+    ``max_offset`` pixels from the smoothed position, and are scaled by the
+    caller's ``weight`` so they can be faded out near a pinch.
+    """
+
+    # Smoothing of the delay, velocity and acceleration estimates per sample
+    DELAY_SMOOTHING = 0.1
+    VELOCITY_SMOOTHING = 0.5
+    ACCELERATION_SMOOTHING = 0.3
+    # Samples further apart than this start a new motion
+    MAX_SAMPLE_GAP = 0.2
+
+    def __init__(self, offset=0.03, max_horizon=0.15, max_offset=120, acceleration=0.5, smoothing=0.5):
+        self.offset = offset
+        self.max_horizon = max_horizon
+        self.max_offset = max_offset
+        self.acceleration = acceleration
+        self.smoothing = smoothing
+
+        self.delay = 0.0
+        self.frame_interval = 0.0
+        self._last = None
+        self._velocity = (0.0, 0.0)
+        self._accel = (0.0, 0.0)
+
+    def reset(self):
+        """Forget the current motion, e.g. after the hand stopped pointing"""
+        self._last = None
+        self._velocity = (0.0, 0.0)
+        self._accel = (0.0, 0.0)
+
+    @property
+    def horizon(self):
+        """Seconds the pointer is extrapolated ahead"""
+        smoothing_lag = self.frame_interval * (1 - self.smoothing) / self.smoothing if self.smoothing > 0 else 0.0
+        return min(self.max_horizon, self.delay + self.offset + smoothing_lag)
+
+    def predict(self, x, y, timestamp, weight=1.0):
+        """Return where (x, y), smoothed from a frame captured at timestamp, is now"""
+        measured = max(0.0, time.perf_counter() - timestamp)
+        self.delay += (measured - self.delay) * self.DELAY_SMOOTHING if self.delay else measured
+
+        last = self._last
+        self._last = (x, y, timestamp)
+        if last is None or not 0 < timestamp - last[2] < self.MAX_SAMPLE_GAP:
+            self._velocity = (0.0, 0.0)
+            self._accel = (0.0, 0.0)
+            return x, y
+
+        dt = timestamp - last[2]
+        self.frame_interval += (dt - self.frame_interval) * self.DELAY_SMOOTHING if self.frame_interval else dt
+
+        vx, vy = self._velocity
+        new_vx = vx + ((x - last[0]) / dt - vx) * self.VELOCITY_SMOOTHING
+        new_vy = vy + ((y - last[1]) / dt - vy) * self.VELOCITY_SMOOTHING
+        ax, ay = self._accel
+        ax += ((new_vx - vx) / dt - ax) * self.ACCELERATION_SMOOTHING
+        ay += ((new_vy - vy) / dt - ay) * self.ACCELERATION_SMOOTHING
+        self._velocity, self._accel = (new_vx, new_vy), (ax, ay)
+
+        if weight <= 0:
+            return x, y
+        h = self.horizon
+        dx = new_vx * h + 0.5 * self.acceleration * ax * h * h
+        dy = new_vy * h + 0.5 * self.acceleration * ay * h * h
+
+        length = math.hypot(dx, dy)
+        if length > self.max_offset:
+            dx, dy = dx * self.max_offset / length, dy * self.max_offset / length
+        weight = min(1.0, weight)
+        return x + dx * weight, y + dy * weight
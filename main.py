@@ -1,11 +1,11 @@
 import cv2
-import numpy as np
 import pyautogui
 import time
 import speech_recognition as sr
 import threading
 import math
 from pynput.mouse import Button, Controller
+from screen_geometry import ScreenGeometry
 
 # Initialize mouse controller
 mouse = Controller()
@@ -15,6 +15,7 @@ THUMB_TIP_ID = 4  # MediaPipe thumb tip landmark
 INDEX_TIP_ID = 8  # MediaPipe index finger tip landmark
 ACTIVATION_DISTANCE = 50  # pixels distance to activate mouse movement
 CLICK_DISTANCE = 30  # pixels distance to register a click
+ACTIVE_REGION = (0.15, 0.1, 0.85, 0.8)  # part of the frame mapped to the screen
 
 # Voice command flags
 voice_control_active = False
@@ -35,7 +36,7 @@ except ImportError:
     print("MediaPipe not available. Thumb tracking will be disabled.")
     hand_tracking_available = False
 
-def process_voice_commands():
+def process_voice_commands(screen):
     global voice_control_active, last_voice_command_time
     
     recognizer = sr.Recognizer()
@@ -45,6 +46,8 @@ def process_voice_commands():
         recognizer.adjust_for_ambient_noise(source)
     
     while True:
+        # Display changes are picked up here, off the camera loop
+        screen.refresh()
         try:
             with microphone as source:
                 print("Listening for voice commands...")
@@ -102,8 +105,11 @@ def calculate_distance(point1, point2):
 def main():
     global voice_control_active, last_voice_command_time
     
+    # Cached display layout and hand-to-screen mapping
+    screen = ScreenGeometry(ACTIVE_REGION)
+    
     # Start voice command thread
-    voice_thread = threading.Thread(target=process_voice_commands, daemon=True)
+    voice_thread = threading.Thread(target=process_voice_commands, args=(screen,), daemon=True)
     voice_thread.start()
     
     # Initialize camera
@@ -112,9 +118,6 @@ def main():
         print("Error: Could not open camera.")
         return
     
-    # Get screen size
-    screen_width, screen_height = pyautogui.size()
-    
     # Variables for smoothing mouse movement
     prev_x, prev_y = 0, 0
     smoothing_factor = 0.5
@@ -187,8 +190,7 @@ def main():
                     # If distance is in activation range, move mouse
                     if ACTIVATION_DISTANCE < distance < 300:
                         # Map hand position to screen coordinates
-                        screen_x = np.interp(thumb_x, (0, frame_width), (0, screen_width))
-                        screen_y = np.interp(thumb_y, (0, frame_height), (0, screen_height))
+                        screen_x, screen_y = screen.map_point(thumb_tip.x, thumb_tip.y)
                         
                         # Smooth mouse movement
                         smooth_x = prev_x + (screen_x - prev_x) * smoothing_factor
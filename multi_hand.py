@@ -0,0 +1,273 @@
+import itertools
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from hand_tracking import MAX_HANDS, NUM_LANDMARKS, landmarks_to_array
+
+# Handedness codes as stored in tracking records
+HANDEDNESS = ("left", "right")
+
+
+def assign_roles(handedness, pointer_hand="right"):
+    """Role of each hand: "pointer" or "modifier".
+
+    The first hand of ``pointer_hand`` points and every other hand
+    modifies. If no hand has that handedness, or ``pointer_hand`` is None,
+    the first hand points, so a single hand of either side still works.
+    """
+    roles = ["modifier"] * len(handedness)
+    if not roles:
+        return roles
+    pointer = 0
+    if pointer_hand is not None:
+        code = HANDEDNESS.index(pointer_hand)
+        pointer = next((i for i, h in enumerate(handedness) if h == code), 0)
+    roles[pointer] = "pointer"
+    return roles
+
+
+class TrackedHand:
+    """One hand followed across frames by its own landmark model"""
+
+    # Weight of each classification in the running handedness estimate
+    HANDEDNESS_SMOOTHING = 0.3
+
+    def __init__(self, hand_id, model):
+        self.id = hand_id
+        self.model = model
+        self.points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.right_score = 0.5
+        self.roi = None         # (x0, y0, x1, y1) in pixels
+        self.thumbnail = None   # grey thumbnail of the ROI at the last inference
+        self.skipped = 0
+        self.missed = 0
+
+    @property
+    def handedness(self):
+        return 1 if self.right_score >= 0.5 else 0
+
+    @property
+    def fresh(self):
+        """False while the hand is lost and reported at its last position"""
+        return self.missed == 0
+
+    def vote(self, label, score):
+        """Fold one handedness classification into the running estimate"""
+        target = 1.0 if label == "Right" else 0.0
+        self.right_score += (target - self.right_score) * self.HANDEDNESS_SMOOTHING * score
+
+
+class HandTracker:
+    """Up to two hands with stable ids, each tracked in its own region of interest.
+
+    A full-frame search runs while no hand is tracked, and every
+    ``detect_interval`` frames while fewer than ``max_hands`` are. Between
+    searches each hand is followed by a single-hand model on a crop around
+    its last landmarks; the crop only moves when the hand nears its edge so
+    the model can keep tracking inside it. When the modifier hand's crop
+    (see ``assign_roles`` and ``pointer_hand``) has barely changed since its
+    last inference (mean grey-level change below ``idle_threshold``) its
+    landmarks are reused for up to ``idle_interval`` frames, so a second
+    hand that is present but idle costs almost nothing. The pointer hand
+    is always re-run, since slow precise moves would otherwise stall.
+    Two tracks that settle on the same hand are merged into the older one.
+    Hands lost for up to ``max_missed`` frames are still reported at their
+    last position, which keeps ids and roles from flickering; their
+    ``fresh`` flag is cleared so callers do not read gestures from them.
+    """
+
+    THUMBNAIL_SIZE = (24, 24)
+    # Matching cost limit between a detection and a track, normalized units
+    MAX_MATCH_DISTANCE = 0.25
+    HANDEDNESS_PENALTY = 0.1
+    # Share of the smaller hand's box two tracks must overlap to be one hand
+    DUPLICATE_OVERLAP = 0.6
+    # Extra space around the landmarks on each side, relative to the hand size
+    ROI_MARGIN = 0.35
+    MIN_ROI = 96
+
+    def __init__(self, max_hands=2, pointer_hand="right", detect_interval=15, idle_interval=5,
+                 idle_threshold=4.0, max_missed=3, min_detection_confidence=0.7, min_tracking_confidence=0.7):
+        self.max_hands = max_hands
+        self.pointer_hand = pointer_hand
+        self.detect_interval = detect_interval
+        self.idle_interval = idle_interval
+        self.idle_threshold = idle_threshold
+        self.max_missed = max_missed
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+
+        self.detector = mp.solutions.hands.Hands(
+            static_image_mode=True,
+            max_num_hands=MAX_HANDS,
+            min_detection_confidence=min_detection_confidence
+        )
+        self.hands = []
+        self.frame_index = 0
+        self.last_search = None
+        # Counters for benchmarks: model runs, full-frame searches and reused landmarks
+        self.inferences = 0
+        self.searches = 0
+        self.idle_skips = 0
+        self._ids = itertools.count(1)
+
+    def process(self, frame):
+        """Track hands in an RGB frame; return the tracked hands ordered by id"""
+        self.frame_index += 1
+        searched = set()
+        if not self.hands or (
+                len(self.hands) < self.max_hands
+                and self.frame_index - self.last_search >= self.detect_interval):
+            self.last_search = self.frame_index
+            searched = self.search(frame)
+
+        roles = assign_roles([hand.handedness for hand in self.hands], self.pointer_hand)
+        for hand, role in zip(list(self.hands), roles):
+            if hand.id not in searched:
+                self.follow(hand, frame, may_skip=role == "modifier")
+        self.merge_duplicates()
+        return self.hands
+
+    def search(self, frame):
+        """Full-frame detection; match results to tracks, return the ids updated"""
+        results = self.detector.process(frame)
+        self.inferences += 1
+        self.searches += 1
+        if not results.multi_hand_landmarks:
+            return set()
+
+        detections = []
+        for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+            classification = handedness.classification[0]
+            detections.append((landmarks_to_array(hand_landmarks), classification.label, classification.score))
+
+        # Greedy nearest-centre matching keeps ids stable across searches
+        costs = []
+        for i, (points, label, _) in enumerate(detections):
+            centre = points[:, :2].mean(axis=0)
+            for hand in self.hands:
+                cost = float(np.linalg.norm(hand.points[:, :2].mean(axis=0) - centre))
+                if hand.handedness != (label == "Right"):
+                    cost += self.HANDEDNESS_PENALTY
+                costs.append((cost, i, hand))
+        matches = {}
+        for cost, i, hand in sorted(costs, key=lambda c: c[0]):
+            if cost <= self.MAX_MATCH_DISTANCE and i not in matches and hand not in matches.values():
+                matches[i] = hand
+
+        updated = set()
+        for i, (points, label, score) in enumerate(detections):
+            hand = matches.get(i)
+            if hand is None:
+                if len(self.hands) >= self.max_hands:
+                    continue
+                hand = TrackedHand(next(self._ids), mp.solutions.hands.Hands(
+                    max_num_hands=1,
+                    min_detection_confidence=self.min_detection_confidence,
+                    min_tracking_confidence=self.min_tracking_confidence
+                ))
+                self.hands.append(hand)
+            self.update(hand, points, label, score, frame)
+            updated.add(hand.id)
+        self.hands.sort(key=lambda hand: hand.id)
+        return updated
+
+    def follow(self, hand, frame, may_skip=False):
+        """Re-run one hand's model on its crop, unless may_skip and the crop is unchanged"""
+        height, width = frame.shape[:2]
+        x0, y0, x1, y1 = hand.roi
+        crop = frame[y0:y1, x0:x1]
+
+        if may_skip and hand.skipped < self.idle_interval and self.unchanged(hand, crop):
+            hand.skipped += 1
+            self.idle_skips += 1
+            return
+        hand.skipped = 0
+
+        results = hand.model.process(np.ascontiguousarray(crop))
+        self.inferences += 1
+        if not results.multi_hand_landmarks:
+            hand.missed += 1
+            if hand.missed > self.max_missed:
+                hand.model.close()
+                self.hands.remove(hand)
+            return
+
+        # Crop coordinates back to the full frame
+        points = landmarks_to_array(results.multi_hand_landmarks[0])
+        points[:, 0] = (x0 + points[:, 0] * (x1 - x0)) / width
+        points[:, 1] = (y0 + points[:, 1] * (y1 - y0)) / height
+        points[:, 2] *= (x1 - x0) / width
+        classification = results.multi_handedness[0].classification[0]
+        self.update(hand, points, classification.label, classification.score, frame)
+
+    def merge_duplicates(self):
+        """Drop the newer of two tracks whose landmarks cover the same hand"""
+        for i, first in enumerate(self.hands):
+            for second in self.hands[i + 1:]:
+                if self.overlap(first.points, second.points) > self.DUPLICATE_OVERLAP:
+                    second.model.close()
+                    self.hands.remove(second)
+                    return self.merge_duplicates()
+
+    @staticmethod
+    def overlap(a, b):
+        """Intersection of two hands' landmark boxes over the smaller box"""
+        (ax0, ay0), (ax1, ay1) = a[:, :2].min(axis=0), a[:, :2].max(axis=0)
+        (bx0, by0), (bx1, by1) = b[:, :2].min(axis=0), b[:, :2].max(axis=0)
+        width = min(ax1, bx1) - max(ax0, bx0)
+        height = min(ay1, by1) - max(ay0, by0)
+        if width <= 0 or height <= 0:
+            return 0.0
+        smaller = min((ax1 - ax0) * (ay1 - ay0), (bx1 - bx0) * (by1 - by0))
+        return float(width * height / smaller) if smaller > 0 else 1.0
+
+    def update(self, hand, points, label, score, frame):
+        hand.points = points
+        hand.missed = 0
+        hand.skipped = 0
+        hand.vote(label, score)
+        self.place_roi(hand, frame.shape)
+        x0, y0, x1, y1 = hand.roi
+        hand.thumbnail = self.thumbnail(frame[y0:y1, x0:x1])
+
+    def place_roi(self, hand, frame_shape):
+        """Keep the crop where it is unless the hand nears its edge or changed size"""
+        height, width = frame_shape[:2]
+        xs = hand.points[:, 0] * width
+        ys = hand.points[:, 1] * height
+        x0, x1, y0, y1 = xs.min(), xs.max(), ys.min(), ys.max()
+        extent = max(x1 - x0, y1 - y0)
+
+        if hand.roi is not None:
+            rx0, ry0, rx1, ry1 = hand.roi
+            inset = extent * self.ROI_MARGIN / 2
+            roi_size = max(rx1 - rx0, ry1 - ry0)
+            if (x0 - inset >= rx0 and x1 + inset <= rx1 and y0 - inset >= ry0 and y1 + inset <= ry1
+                    and extent * (1 + 2 * self.ROI_MARGIN) > roi_size * 0.6):
+                return
+
+        size = max(extent * (1 + 2 * self.ROI_MARGIN), self.MIN_ROI)
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        hand.roi = (
+            int(max(0, cx - size / 2)), int(max(0, cy - size / 2)),
+            int(min(width, cx + size / 2)), int(min(height, cy + size / 2)),
+        )
+
+    def thumbnail(self, crop):
+        grey = cv2.cvtColor(crop, cv2.COLOR_RGB2GRAY)
+        return cv2.resize(grey, self.THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+
+    def unchanged(self, hand, crop):
+        if hand.thumbnail is None or crop.size == 0:
+            return False
+        change = cv2.absdiff(self.thumbnail(crop), hand.thumbnail)
+        return float(change.mean()) < self.idle_threshold
+
+    def close(self):
+        for hand in self.hands:
+            hand.model.close()
+        self.hands = []
+        self.detector.close()
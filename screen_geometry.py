@@ -0,0 +1,129 @@
+import time
+
+import pyautogui
+
+# screeninfo is optional; without it only the primary display is known
+try:
+    from screeninfo import get_monitors
+    screeninfo_available = True
+except ImportError:
+    screeninfo_available = False
+
+
+class ScreenGeometry:
+    """Cached display layout and camera-to-screen mapping.
+
+    The layout is queried once and then only re-checked by ``refresh``,
+    at most every ``refresh_interval`` seconds. Mapping never queries the
+    system, so the per-frame cost of mapping a point is a couple of
+    multiply-adds; callers run ``refresh`` from a thread off the hot path. ``active_region`` is the (left, top,
+    right, bottom) part of the camera frame, in normalized coordinates,
+    that is stretched over the target display. ``monitor`` selects a
+    display by index, or spans every display when it is None.
+    """
+
+    def __init__(self, active_region=(0.0, 0.0, 1.0, 1.0), monitor=None, refresh_interval=2.0):
+        self.active_region = self._check_region(active_region)
+        self.monitor = monitor
+        self.refresh_interval = refresh_interval
+        self.monitors = ()
+        self.bounds = (0, 0, 1, 1)
+        self._coeffs = (0.0, 0.0, 0.0, 0.0)
+        self._last_refresh = 0.0
+        self.refresh(force=True)
+
+    @staticmethod
+    def _check_region(region):
+        left, top, right, bottom = (float(v) for v in region)
+        if not (0.0 <= left < right <= 1.0 and 0.0 <= top < bottom <= 1.0):
+            raise ValueError(f"Invalid active region: {region}")
+        return (left, top, right, bottom)
+
+    def query_monitors(self):
+        """Return the display layout as a tuple of (x, y, width, height)"""
+        if screeninfo_available:
+            try:
+                monitors = tuple((m.x, m.y, m.width, m.height) for m in get_monitors())
+                if monitors:
+                    return monitors
+            except Exception as e:
+                print(f"Monitor query error: {e}")
+        width, height = pyautogui.size()
+        return ((0, 0, width, height),)
+
+    def refresh(self, force=False):
+        """Re-read the display layout if the refresh interval has passed.
+
+        Returns True when the layout changed and the transform was rebuilt.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.refresh_interval:
+            return False
+        self._last_refresh = now
+
+        monitors = self.query_monitors()
+        if not force and monitors == self.monitors:
+            return False
+        self.monitors = monitors
+        self._update_transform()
+        return True
+
+    def _update_transform(self):
+        if self.monitor is None:
+            x0 = min(m[0] for m in self.monitors)
+            y0 = min(m[1] for m in self.monitors)
+            x1 = max(m[0] + m[2] for m in self.monitors)
+            y1 = max(m[1] + m[3] for m in self.monitors)
+            self.bounds = (x0, y0, x1 - x0, y1 - y0)
+        else:
+            self.bounds = self.monitors[min(self.monitor, len(self.monitors) - 1)]
+
+        x, y, width, height = self.bounds
+        left, top, right, bottom = self.active_region
+        scale_x = (width - 1) / (right - left)
+        scale_y = (height - 1) / (bottom - top)
+        self._coeffs = (scale_x, x - left * scale_x, scale_y, y - top * scale_y)
+
+    @property
+    def size(self):
+        """Width and height of the target area"""
+        return self.bounds[2], self.bounds[3]
+
+    def calibrate(self, region):
+        """Set the active region of the camera frame"""
+        self.active_region = self._check_region(region)
+        self._update_transform()
+
+    def monitor_at(self, x, y):
+        """Return the display rectangle containing (x, y), or the target area"""
+        for monitor in self.monitors:
+            mx, my, mw, mh = monitor
+            if mx <= x < mx + mw and my <= y < my + mh:
+                return monitor
+        return self.bounds
+
+    def clamp(self, x, y):
+        """Clamp a screen point to the target area"""
+        bx, by, width, height = self.bounds
+        x = max(bx, min(bx + width - 1, x))
+        y = max(by, min(by + height - 1, y))
+
+        # A spanned layout may have gaps; snap to the nearest display
+        if self.monitor is None and len(self.monitors) > 1:
+            best = None
+            for mx, my, mw, mh in self.monitors:
+                cx = max(mx, min(mx + mw - 1, x))
+                cy = max(my, min(my + mh - 1, y))
+                dist = (cx - x) ** 2 + (cy - y) ** 2
+                if dist == 0:
+                    return x, y
+                if best is None or dist < best[0]:
+                    best = (dist, cx, cy)
+            x, y = best[1], best[2]
+        return x, y
+
+    def map_point(self, nx, ny):
+        """Map a normalized camera point to screen coordinates"""
+        scale_x, offset_x, scale_y, offset_y = self._coeffs
+        return self.clamp(scale_x * nx + offset_x, scale_y * ny + offset_y)
+
@@ -0,0 +1,177 @@
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import pyautogui
+from PIL import Image
+
+# mss grabs straight from the compositor and is much faster than pyautogui
+try:
+    import mss
+    mss_available = True
+except ImportError:
+    mss_available = False
+
+# Encoder settings tuned for speed rather than size
+FORMATS = {
+    "png": {"compress_level": 1},
+    "jpg": {"quality": 90},
+    "bmp": {},
+}
+
+
+class Capture:
+    """A grabbed screenshot; ``path`` is set once it has been written"""
+
+    def __init__(self, image, region, timestamp):
+        self.image = image
+        self.region = region
+        self.timestamp = timestamp
+        self.path = None
+
+
+def active_window_region():
+    """Return (left, top, width, height) of the focused window, or None"""
+    try:
+        import pygetwindow
+        window = pygetwindow.getActiveWindow()
+        if window is not None:
+            return (window.left, window.top, window.width, window.height)
+    except Exception:
+        pass
+
+    # macOS: the frontmost on-screen window of the active application
+    try:
+        import Quartz
+        from AppKit import NSWorkspace
+        pid = NSWorkspace.sharedWorkspace().frontmostApplication().processIdentifier()
+        windows = Quartz.CGWindowListCopyWindowInfo(
+            Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+            Quartz.kCGNullWindowID
+        )
+        for window in windows:
+            if window["kCGWindowOwnerPID"] == pid and window["kCGWindowLayer"] == 0:
+                bounds = window["kCGWindowBounds"]
+                return (int(bounds["X"]), int(bounds["Y"]), int(bounds["Width"]), int(bounds["Height"]))
+    except Exception:
+        pass
+    return None
+
+
+class ScreenshotService:
+    """Grabs screenshots and encodes them in the background.
+
+    With mss, ``capture`` grabs on the caller's thread, which takes a few
+    milliseconds, and returns as soon as the pixels are in memory. The
+    pyautogui fallback is much slower (on macOS it runs screencapture and
+    decodes a PNG), so without mss the worker grabs as well. Either way a
+    worker thread writes captures to uniquely named files in
+    ``directory``. The most recent captures are also kept in ``recent``.
+    ``screen`` is used to keep regions around the pointer on its display.
+    """
+
+    def __init__(self, directory="screenshots", image_format="png", keep_recent=5,
+                 max_pending=8, on_saved=None, screen=None):
+        if image_format not in FORMATS:
+            raise ValueError(f"Unsupported screenshot format: {image_format}")
+        self.directory = directory
+        self.image_format = image_format
+        self.on_saved = on_saved
+        self.screen = screen
+        self.recent = deque(maxlen=keep_recent)
+        self._local = threading.local()
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._worker = threading.Thread(target=self._encode_loop, daemon=True)
+        self._worker.start()
+
+    def grab(self, region=None):
+        """Return a PIL image of region (left, top, width, height) or the whole screen"""
+        if mss_available:
+            grabber = getattr(self._local, "mss", None)
+            if grabber is None:
+                # mss handles are not shareable between threads
+                grabber = self._local.mss = mss.mss()
+            if region is None:
+                monitor = grabber.monitors[0]
+            else:
+                left, top, width, height = region
+                monitor = {"left": left, "top": top, "width": width, "height": height}
+            shot = grabber.grab(monitor)
+            return Image.frombuffer("RGB", shot.size, shot.bgra, "raw", "BGRX")
+        return pyautogui.screenshot(region=region)
+
+    def capture(self, region=None):
+        """Queue a capture of region for grabbing and encoding; returns the Capture"""
+        image = self.grab(region) if mss_available else None
+        capture = Capture(image, region, time.time())
+        self.recent.append(capture)
+        try:
+            self._pending.put_nowait(capture)
+        except queue.Full:
+            if capture.image is None:
+                print("Screenshot worker is busy, capture skipped")
+            else:
+                print("Screenshot encoder is busy, capture kept in memory only")
+        return capture
+
+    def capture_window(self):
+        return self.capture(active_window_region())
+
+    def capture_around(self, x, y, width=800, height=600):
+        """Capture a region centred on (x, y), e.g. the pointer, kept on its display"""
+        if self.screen is None:
+            return self.capture((max(0, int(x - width / 2)), max(0, int(y - height / 2)), width, height))
+        mx, my, mw, mh = (int(v) for v in self.screen.monitor_at(x, y))
+        width, height = min(width, mw), min(height, mh)
+        left = max(mx, min(mx + mw - width, int(x - width / 2)))
+        top = max(my, min(my + mh - height, int(y - height / 2)))
+        return self.capture((left, top, width, height))
+
+    def _create_file(self, capture):
+        """Create a new file named after the capture time; return (path, file).
+
+        Exclusive creation never overwrites a file, so captures in the same
+        millisecond, or names left by an earlier run, get a numeric suffix.
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(capture.timestamp))
+        millis = int(capture.timestamp * 1000) % 1000
+        base = os.path.join(self.directory, f"screenshot-{stamp}-{millis:03d}")
+        for n in itertools.count():
+            path = f"{base}-{n}.{self.image_format}" if n else f"{base}.{self.image_format}"
+            try:
+                return path, open(path, "xb")
+            except FileExistsError:
+                continue
+
+    def _encode_loop(self):
+        while True:
+            capture = self._pending.get()
+            if capture is None:
+                break
+            try:
+                if capture.image is None:
+                    capture.image = self.grab(capture.region)
+                os.makedirs(self.directory, exist_ok=True)
+                path, f = self._create_file(capture)
+                try:
+                    with f:
+                        capture.image.save(f, Image.registered_extensions()[f".{self.image_format}"],
+                                           **FORMATS[self.image_format])
+                except Exception:
+                    os.unlink(path)
+                    raise
+                capture.path = path
+                if self.on_saved:
+                    self.on_saved(path)
+            except Exception as e:
+                print(f"Screenshot error: {e}")
+            finally:
+                self._pending.task_done()
+
+    def close(self, timeout=5):
+        """Finish writing queued captures and stop the worker"""
+        self._pending.put(None)
+        self._worker.join(timeout)
@@ -0,0 +1,145 @@
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from voice_feedback import (PRIORITY_CONFIRM, PRIORITY_ERROR, BargeInStream, FeedbackService,
+                            MutedBackend)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the feedback worker")
+        time.sleep(0.005)
+
+
+class BlockingBackend(MutedBackend):
+    """Holds the worker in ``say`` until released or stopped"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.stops = 0
+
+    def say(self, text):
+        super().say(text)
+        self.started.set()
+        self.release.wait(2)
+
+    def stop(self):
+        self.stops += 1
+        self.release.set()
+
+
+class FakeStream:
+    """Microphone stream returning 16-bit chunks of constant amplitude"""
+
+    def __init__(self, amplitudes):
+        self.amplitudes = list(amplitudes)
+
+    def read(self, size):
+        return np.full(size, self.amplitudes.pop(0), dtype=np.int16).tobytes()
+
+
+class FakeFeedback:
+    def __init__(self, speaking):
+        self.speaking = speaking
+        self.cancels = 0
+
+    def cancel(self):
+        self.cancels += 1
+
+
+class FeedbackServiceTest(unittest.TestCase):
+    def test_full_queue_drops_least_urgent(self):
+        backend = BlockingBackend()
+        service = FeedbackService(backend, max_pending=2, coalesce_window=0)
+        self.addCleanup(service.close)
+        service.say("first")
+        self.assertTrue(backend.started.wait(2))
+
+        self.assertTrue(service.say("second"))
+        self.assertTrue(service.say("third"))
+        self.assertTrue(service.say("failed", PRIORITY_ERROR))
+        self.assertFalse(service.say("fourth", PRIORITY_CONFIRM))
+
+        backend.release.set()
+        wait_for(lambda: len(backend.spoken) == 3)
+        self.assertEqual(backend.spoken, ["first", "failed", "second"])
+
+    def test_repeats_are_coalesced(self):
+        backend = MutedBackend()
+        service = FeedbackService(backend, coalesce_window=60)
+        self.addCleanup(service.close)
+        self.assertTrue(service.say("scrolled"))
+        wait_for(lambda: backend.spoken)
+        self.assertFalse(service.say("scrolled"))
+
+        service.coalesce_window = 0
+        self.assertTrue(service.say("scrolled"))
+        wait_for(lambda: len(backend.spoken) == 2)
+
+    def test_pending_duplicate_is_not_queued(self):
+        backend = BlockingBackend()
+        service = FeedbackService(backend, coalesce_window=0)
+        self.addCleanup(service.close)
+        service.say("first")
+        self.assertTrue(backend.started.wait(2))
+        self.assertTrue(service.say("holding"))
+        self.assertFalse(service.say("holding"))
+
+    def test_cancel_clears_queue_and_stops_speech(self):
+        backend = BlockingBackend()
+        service = FeedbackService(backend, coalesce_window=0)
+        self.addCleanup(service.close)
+        service.say("first")
+        self.assertTrue(backend.started.wait(2))
+        service.say("second")
+
+        service.cancel()
+        self.assertEqual(backend.stops, 1)
+        time.sleep(0.05)
+        self.assertEqual(backend.spoken, ["first"])
+
+
+class BargeInStreamTest(unittest.TestCase):
+    THRESHOLD = 100
+    LEVEL = 2.0
+
+    def stream(self, amplitudes, speaking=True):
+        feedback = FakeFeedback(speaking)
+        return BargeInStream(FakeStream(amplitudes), feedback, lambda: self.THRESHOLD, self.LEVEL), feedback
+
+    def test_speech_over_the_level_cuts_feedback_off_once(self):
+        stream, feedback = self.stream([250, 250])
+        stream.read(160)
+        stream.read(160)
+        self.assertEqual(feedback.cancels, 1)
+        self.assertFalse(stream.overheard)
+
+    def test_echo_that_starts_a_phrase_is_overheard(self):
+        # Above the recognizer threshold but below the barge-in level
+        stream, feedback = self.stream([150])
+        stream.read(160)
+        self.assertEqual(feedback.cancels, 0)
+        self.assertTrue(stream.overheard)
+
+    def test_quiet_chunks_are_ignored(self):
+        stream, feedback = self.stream([50])
+        stream.read(160)
+        self.assertEqual(feedback.cancels, 0)
+        self.assertFalse(stream.overheard)
+
+    def test_nothing_happens_without_feedback(self):
+        stream, feedback = self.stream([250], speaking=False)
+        stream.read(160)
+        self.assertEqual(feedback.cancels, 0)
+        self.assertFalse(stream.overheard)
+
+
+if __name__ == "__main__":
+    unittest.main()
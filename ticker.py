@@ -0,0 +1,56 @@
+import threading
+import time
+
+
+class Ticker:
+    """Timer thread calling ``tick(dt)`` at a fixed rate while there is work.
+
+    The thread sleeps until ``wake`` while ``active()`` is False. Once
+    active it calls ``begin`` (if given) and then ``tick`` with the seconds
+    since the previous call, about zero on the first, ``rate`` times per
+    second until ``tick`` returns False. Ticks follow a fixed schedule so
+    they do not drift; a tick that runs late restarts the schedule instead
+    of bunching up the following ones. ``rate`` is read on every tick, so a
+    change applies at once.
+    """
+
+    def __init__(self, tick, active, rate=60, begin=None):
+        self.tick = tick
+        self.active = active
+        self.rate = rate
+        self.begin = begin
+
+        self._wake = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while self._running:
+            if not self.active():
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            if self.begin is not None:
+                self.begin()
+            next_tick = last = time.perf_counter()
+            while self._running:
+                now = time.perf_counter()
+                dt, last = now - last, now
+                if not self.tick(dt):
+                    break
+
+                next_tick += 1.0 / self.rate
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.perf_counter()
+
+    def close(self):
+        self._running = False
+        self._wake.set()
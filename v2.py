@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import cv2
-import numpy as np
 import pyautogui
 import speech_recognition as sr
 import threading
@@ -10,6 +9,8 @@ from pynput.mouse import Button, Controller
 import platform
 import time
 import mediapipe as mp
+from screen_geometry import ScreenGeometry
+from event_bus import EventBus, ControlStore, ControlChanged, FrameReady, ErrorRaised
 
 class VirtualMouseApp:
     def __init__(self, root):
@@ -21,9 +22,10 @@ class VirtualMouseApp:
         self.os_name = platform.system()
         self.check_dependencies()
         
-        # Control variables
-        self.hand_control_active = False
-        self.voice_control_active = False
+        # Control state shared with the worker threads; they never touch
+        # Tk widgets directly but publish events that the UI drains
+        self.bus = EventBus()
+        self.control = ControlStore(self.bus)
         self.running = True
         self.last_voice_time = 0
         
@@ -46,9 +48,17 @@ class VirtualMouseApp:
         self.INDEX_TIP_ID = 8
         self.ACTIVATION_DISTANCE = 50
         self.CLICK_DISTANCE = 30
+        self.ACTIVE_REGION = (0.15, 0.1, 0.85, 0.8)  # part of the frame mapped to the screen
+        
+        # Cached display layout and hand-to-screen mapping
+        self.screen = ScreenGeometry(self.ACTIVE_REGION)
         
         # Create UI
         self.create_ui()
+        self.bus.subscribe(ControlChanged, self.on_control_changed)
+        self.bus.subscribe(FrameReady, self.on_frame_ready)
+        self.bus.subscribe(ErrorRaised, self.on_error)
+        self.bus.attach_tk(self.root)
         
         # Start threads
         self.camera_thread = threading.Thread(target=self.camera_loop, daemon=True)
@@ -150,38 +160,40 @@ class VirtualMouseApp:
         self.camera_label.pack()
     
     def toggle_hand_control(self):
-        self.hand_control_active = not self.hand_control_active
-        status = "ON" if self.hand_control_active else "OFF"
-        self.hand_status.config(text=f"Hand Control: {status}")
-        self.hand_btn.config(
-            text="Disable Hand Control" if self.hand_control_active else "Enable Hand Control"
-        )
-        
-        if self.hand_control_active and self.voice_control_active:
-            self.voice_control_active = False
-            self.voice_status.config(text="Voice Control: OFF")
-            self.voice_btn.config(text="Enable Voice Control")
+        def flip(state):
+            hand_active = not state.hand_active
+            return state._replace(
+                hand_active=hand_active,
+                voice_active=state.voice_active and not hand_active
+            )
+        self.control.modify(flip)
     
     def toggle_voice_control(self):
-        self.voice_control_active = not self.voice_control_active
-        status = "ON" if self.voice_control_active else "OFF"
-        self.voice_status.config(text=f"Voice Control: {status}")
-        self.voice_btn.config(
-            text="Disable Voice Control" if self.voice_control_active else "Enable Voice Control"
-        )
-        
-        if self.voice_control_active and self.hand_control_active:
-            self.hand_control_active = False
-            self.hand_status.config(text="Hand Control: OFF")
-            self.hand_btn.config(text="Enable Hand Control")
+        def flip(state):
+            voice_active = not state.voice_active
+            return state._replace(
+                voice_active=voice_active,
+                hand_active=state.hand_active and not voice_active
+            )
+        self.control.modify(flip)
+    
+    def on_control_changed(self, event):
+        self.update_ui_status(event.state)
+    
+    def on_frame_ready(self, event):
+        img_tk = self.cv2_to_tkinter(event.image)
+        self.camera_label.config(image=img_tk)
+        self.camera_label.image = img_tk
+    
+    def on_error(self, event):
+        messagebox.showerror(event.title, event.message)
     
     def camera_loop(self):
         cap = cv2.VideoCapture(0)
         if not cap.isOpened():
-            messagebox.showerror("Error", "Could not open camera")
+            self.bus.emit(ErrorRaised, "Error", "Could not open camera")
             return
         
-        screen_width, screen_height = pyautogui.size()
         prev_x, prev_y = 0, 0
         smoothing_factor = 0.5
         click_counter = 0
@@ -193,8 +205,9 @@ class VirtualMouseApp:
             
             frame = cv2.flip(frame, 1)
             frame_height, frame_width, _ = frame.shape
+            state = self.control.snapshot()
             
-            if self.hand_control_active:
+            if state.hand_active:
                 rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 results = self.hands.process(rgb_frame)
                 
@@ -227,8 +240,7 @@ class VirtualMouseApp:
                             click_counter = 0
                         
                         if self.ACTIVATION_DISTANCE < distance < 300:
-                            screen_x = np.interp(thumb_x, (0, frame_width), (0, screen_width))
-                            screen_y = np.interp(thumb_y, (0, frame_height), (0, screen_height))
+                            screen_x, screen_y = self.screen.map_point(thumb_tip.x, thumb_tip.y)
                             
                             smooth_x = prev_x + (screen_x - prev_x) * smoothing_factor
                             smooth_y = prev_y + (screen_y - prev_y) * smoothing_factor
@@ -240,16 +252,14 @@ class VirtualMouseApp:
                                         cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
             
             # Display mode status
-            mode_text = "Hand Mode" if self.hand_control_active else "Voice Mode" if self.voice_control_active else "Idle"
+            mode_text = "Hand Mode" if state.hand_active else "Voice Mode" if state.voice_active else "Idle"
             cv2.putText(frame, mode_text, (frame_width - 200, 30), 
                         cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
             
-            # Convert for Tkinter
+            # Convert for Tkinter; the image itself is built on the UI thread
             img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             img = cv2.resize(img, (320, 240))
-            img_tk = self.cv2_to_tkinter(img)
-            self.camera_label.config(image=img_tk)
-            self.camera_label.image = img_tk
+            self.bus.emit(FrameReady, img)
         
         cap.release()
     
@@ -258,7 +268,9 @@ class VirtualMouseApp:
             self.recognizer.adjust_for_ambient_noise(source)
         
         while self.running:
-            if not self.voice_control_active:
+            # Display changes are picked up here, off the camera loop
+            self.screen.refresh()
+            if not self.control.snapshot().voice_active:
                 time.sleep(0.1)
                 continue
             
@@ -272,12 +284,10 @@ class VirtualMouseApp:
                     self.last_voice_time = time.time()
                     
                     if "start voice" in command or "begin voice" in command:
-                        self.voice_control_active = True
-                        self.update_ui_status()
+                        self.control.update(voice_active=True)
                     elif "stop voice" in command or "end voice" in command:
-                        self.voice_control_active = False
-                        self.update_ui_status()
-                    elif self.voice_control_active:
+                        self.control.update(voice_active=False)
+                    elif self.control.snapshot().voice_active:
                         if "click" in command:
                             self.mouse.click(Button.left)
                         elif "right click" in command:
@@ -301,20 +311,18 @@ class VirtualMouseApp:
             except Exception as e:
                 print("Voice error:", e)
     
-    def update_ui_status(self):
-        if hasattr(self, 'hand_status'):
-            hand_status = "ON" if self.hand_control_active else "OFF"
-            self.hand_status.config(text=f"Hand Control: {hand_status}")
-            self.hand_btn.config(
-                text="Disable Hand Control" if self.hand_control_active else "Enable Hand Control"
-            )
+    def update_ui_status(self, state):
+        hand_status = "ON" if state.hand_active else "OFF"
+        self.hand_status.config(text=f"Hand Control: {hand_status}")
+        self.hand_btn.config(
+            text="Disable Hand Control" if state.hand_active else "Enable Hand Control"
+        )
         
-        if hasattr(self, 'voice_status'):
-            voice_status = "ON" if self.voice_control_active else "OFF"
-            self.voice_status.config(text=f"Voice Control: {voice_status}")
-            self.voice_btn.config(
-                text="Disable Voice Control" if self.voice_control_active else "Enable Voice Control"
-            )
+        voice_status = "ON" if state.voice_active else "OFF"
+        self.voice_status.config(text=f"Voice Control: {voice_status}")
+        self.voice_btn.config(
+            text="Disable Voice Control" if state.voice_active else "Enable Voice Control"
+        )
     
     def cv2_to_tkinter(self, img):
         from PIL import Image, ImageTk
@@ -324,6 +332,7 @@ class VirtualMouseApp:
     
     def on_close(self):
         self.running = False
+        self.bus.detach_tk()
         self.root.destroy()
 
 if __name__ == "__main__":
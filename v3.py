@@ -1,19 +1,17 @@
+import argparse
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-import cv2
-import numpy as np
 import pyautogui
-import speech_recognition as sr
-import threading
-import math
-from pynput.mouse import Button, Controller
 import platform
-import time
-import mediapipe as mp
 from PIL import Image, ImageTk
+from config import load_config
+from engine import MouseEngine
+from event_bus import EventBus, ControlStore, ControlChanged, FrameReady, ErrorRaised, GridChanged
+from grid_overlay import GridOverlay
 
 class VirtualMouseApp:
-    def __init__(self, root):
+    def __init__(self, root, config=None, use_tracking_process=False):
         self.root = root
         self.root.title("Gesture & Voice Controlled Mouse")
         self.root.geometry("600x400")
@@ -21,48 +19,34 @@ class VirtualMouseApp:
         # System check
         self.os_name = platform.system()
         
-        # Control variables
-        self.hand_control_active = False
-        self.voice_control_active = False
-        self.running = True
-        self.last_voice_time = 0
+        # Control state shared with the engine threads; they never touch
+        # Tk widgets directly but publish events that the UI drains
+        self.bus = EventBus()
+        self.control = ControlStore(self.bus)
         
         # Camera window variables
         self.camera_window = None
+        self.camera_photo = None
         self.show_camera = False
         
-        # Initialize controllers
-        self.mouse = Controller()
-        self.recognizer = sr.Recognizer()
-        
-        # MediaPipe setup
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
+        # Tracking and voice engine
+        self.engine = MouseEngine(
+            self.bus, self.control, config=config,
+            use_tracking_process=use_tracking_process
         )
-        self.mp_drawing = mp.solutions.drawing_utils
-        
-        # Constants
-        self.THUMB_TIP_ID = 4
-        self.INDEX_TIP_ID = 8
-        self.MIDDLE_TIP_ID = 12
-        self.RING_TIP_ID = 16
-        self.PINKY_TIP_ID = 20
-        self.ACTIVATION_DISTANCE = 50
-        self.CLICK_DISTANCE = 30
-        self.VOICE_MOVE_SPEED = 100
         
         # Create UI
         self.create_ui()
+        self.grid_overlay = GridOverlay(self.root)
+        self.engine.grid_hidden = threading.Event()
+        self.bus.subscribe(ControlChanged, self.on_control_changed)
+        self.bus.subscribe(FrameReady, self.on_frame_ready)
+        self.bus.subscribe(ErrorRaised, self.on_error)
+        self.bus.subscribe(GridChanged, self.on_grid_changed)
+        self.bus.attach_tk(self.root)
         
         # Start threads
-        self.camera_thread = threading.Thread(target=self.camera_loop, daemon=True)
-        self.camera_thread.start()
-        
-        self.voice_thread = threading.Thread(target=self.voice_loop, daemon=True)
-        self.voice_thread.start()
+        self.engine.start()
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -131,13 +115,19 @@ class VirtualMouseApp:
         - Show your hand to camera
         - Thumb moves cursor
         - Pinch (thumb to index) to click
+        - Index and middle finger up: move hand to scroll,
+          relax the fingers to let the page coast
+        - With two hands the right one points; pinch thumb to
+          index (left click) or middle (right click) on the other
         
         Voice Commands:
         - "click", "right click", "double click"
         - "scroll up", "scroll down"
         - "drag", "release"
         - "start voice", "stop voice"
-        - "move up/down/left/right"
+        - "move up/down/left/right", "faster", "slower", "stop"
+        - "screenshot", "screenshot window/region"
+        - "grid", then "1"-"9" to zoom, "back", "click", "cancel"
         """
         instr_label = ttk.Label(instr_frame, text=instructions, justify=tk.LEFT)
         instr_label.pack()
@@ -156,6 +146,7 @@ class VirtualMouseApp:
             # Camera label
             self.camera_label = ttk.Label(self.camera_frame)
             self.camera_label.pack()
+            self.camera_photo = None
             
             # Tips frame
             tips_frame = ttk.LabelFrame(self.camera_window, text="Hand Tracking Tips", padding=10)
@@ -183,246 +174,97 @@ class VirtualMouseApp:
     
     def close_camera_window(self):
         """Close the camera window and disable hand control"""
-        if self.hand_control_active:
-            self.toggle_hand_control()
+        self.control.update(hand_active=False)
         if self.camera_window:
             self.camera_window.destroy()
             self.camera_window = None
     
     def toggle_hand_control(self):
-        self.hand_control_active = not self.hand_control_active
-        status = "ON" if self.hand_control_active else "OFF"
-        self.hand_status.config(text=f"Hand Control: {status}")
-        self.hand_btn.config(
-            text="Disable Hand Control" if self.hand_control_active else "Enable Hand Control"
-        )
-        
-        if self.hand_control_active:
-            self.create_camera_window()
-            if self.voice_control_active:
-                self.voice_control_active = False
-                self.voice_status.config(text="Voice Control: OFF")
-                self.voice_btn.config(text="Enable Voice Control")
-        else:
-            if self.camera_window:
-                self.camera_window.destroy()
-                self.camera_window = None
+        def flip(state):
+            hand_active = not state.hand_active
+            return state._replace(
+                hand_active=hand_active,
+                voice_active=state.voice_active and not hand_active
+            )
+        self.control.modify(flip)
     
     def toggle_voice_control(self):
-        self.voice_control_active = not self.voice_control_active
-        status = "ON" if self.voice_control_active else "OFF"
-        self.voice_status.config(text=f"Voice Control: {status}")
-        self.voice_btn.config(
-            text="Disable Voice Control" if self.voice_control_active else "Enable Voice Control"
-        )
+        def flip(state):
+            voice_active = not state.voice_active
+            return state._replace(
+                voice_active=voice_active,
+                hand_active=state.hand_active and not voice_active
+            )
+        self.control.modify(flip)
+    
+    def on_control_changed(self, event):
+        """Bring the UI in line with the control state (runs on the Tk thread)"""
+        self.update_ui_status(event.state)
         
-        if self.voice_control_active and self.hand_control_active:
-            self.hand_control_active = False
-            self.hand_status.config(text="Hand Control: OFF")
-            self.hand_btn.config(text="Enable Hand Control")
-            if self.camera_window:
-                self.camera_window.destroy()
-                self.camera_window = None
+        if event.state.hand_active:
+            self.create_camera_window()
+        elif self.camera_window:
+            self.camera_window.destroy()
+            self.camera_window = None
     
-    def camera_loop(self):
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
-            messagebox.showerror("Error", "Could not open camera")
+    def on_frame_ready(self, event):
+        """Show the latest preview frame (runs on the Tk thread)"""
+        if self.camera_window is None or not self.camera_window.winfo_exists():
             return
         
-        screen_width, screen_height = pyautogui.size()
-        prev_x, prev_y = 0, 0
-        smoothing_factor = 0.5
-        click_counter = 0
-        
-        while self.running:
-            ret, frame = cap.read()
-            if not ret:
-                continue
-            
-            frame = cv2.flip(frame, 1)
-            frame_height, frame_width, _ = frame.shape
-            
-            if self.hand_control_active:
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = self.hands.process(rgb_frame)
-                
-                if results.multi_hand_landmarks:
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        # Draw hand landmarks and connections
-                        self.mp_drawing.draw_landmarks(
-                            frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                        
-                        # Get finger positions
-                        thumb_tip = hand_landmarks.landmark[self.THUMB_TIP_ID]
-                        index_tip = hand_landmarks.landmark[self.INDEX_TIP_ID]
-                        middle_tip = hand_landmarks.landmark[self.MIDDLE_TIP_ID]
-                        ring_tip = hand_landmarks.landmark[self.RING_TIP_ID]
-                        pinky_tip = hand_landmarks.landmark[self.PINKY_TIP_ID]
-                        
-                        # Convert to pixel coordinates
-                        thumb_x = int(thumb_tip.x * frame_width)
-                        thumb_y = int(thumb_tip.y * frame_height)
-                        index_x = int(index_tip.x * frame_width)
-                        index_y = int(index_tip.y * frame_height)
-                        middle_x = int(middle_tip.x * frame_width)
-                        middle_y = int(middle_tip.y * frame_height)
-                        ring_x = int(ring_tip.x * frame_width)
-                        ring_y = int(ring_tip.y * frame_height)
-                        pinky_x = int(pinky_tip.x * frame_width)
-                        pinky_y = int(pinky_tip.y * frame_height)
-                        
-                        # Draw colored circles at finger tips
-                        cv2.circle(frame, (thumb_x, thumb_y), 10, (0, 255, 0), -1)  # Green - thumb
-                        cv2.circle(frame, (index_x, index_y), 10, (0, 0, 255), -1)   # Red - index
-                        cv2.circle(frame, (middle_x, middle_y), 8, (255, 0, 0), -1)  # Blue - middle
-                        cv2.circle(frame, (ring_x, ring_y), 8, (255, 255, 0), -1)    # Cyan - ring
-                        cv2.circle(frame, (pinky_x, pinky_y), 8, (255, 0, 255), -1) # Magenta - pinky
-                        
-                        # Draw line between thumb and index when close
-                        distance = math.sqrt((thumb_x - index_x)**2 + (thumb_y - index_y)**2)
-                        if distance < self.CLICK_DISTANCE * 1.5:
-                            cv2.line(frame, (thumb_x, thumb_y), (index_x, index_y), (0, 255, 255), 2)
-                        
-                        # Click detection
-                        if distance < self.CLICK_DISTANCE:
-                            click_counter += 1
-                            if click_counter > 5:
-                                cv2.putText(frame, "CLICK", (50, 50), 
-                                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-                                if click_counter == 6:
-                                    self.mouse.click(Button.left)
-                        else:
-                            click_counter = 0
-                        
-                        # Cursor movement
-                        if self.ACTIVATION_DISTANCE < distance < 300:
-                            screen_x = np.interp(thumb_x, (0, frame_width), (0, screen_width))
-                            screen_y = np.interp(thumb_y, (0, frame_height), (0, screen_height))
-                            
-                            smooth_x = prev_x + (screen_x - prev_x) * smoothing_factor
-                            smooth_y = prev_y + (screen_y - prev_y) * smoothing_factor
-                            
-                            self.mouse.position = (smooth_x, smooth_y)
-                            prev_x, prev_y = smooth_x, smooth_y
-                            
-                            cv2.putText(frame, "MOVING", (50, 100), 
-                                        cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-            
-            # Display mode status
-            mode_text = "HAND MODE" if self.hand_control_active else "VOICE MODE" if self.voice_control_active else "IDLE"
-            cv2.putText(frame, mode_text, (frame_width - 200, 30), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-            
-            # Show in camera window if active
-            if self.hand_control_active and self.camera_window:
-                img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = cv2.resize(img, (640, 480))
-                img_tk = ImageTk.PhotoImage(image=Image.fromarray(img))
-                self.camera_label.config(image=img_tk)
-                self.camera_label.image = img_tk
-        
-        cap.release()
+        # Paste into one PhotoImage instead of creating a new Tk image per frame
+        image = Image.fromarray(event.image)
+        if self.camera_photo is None or (self.camera_photo.width(), self.camera_photo.height()) != image.size:
+            self.camera_photo = ImageTk.PhotoImage(image=image)
+            self.camera_label.config(image=self.camera_photo)
+        else:
+            self.camera_photo.paste(image)
     
-    def take_screenshot(self): 
-        screenshot = pyautogui.screenshot()
-        screenshot.save("screenshot.png")
-    def voice_loop(self):
-        while self.running:
-            if not self.voice_control_active:
-                time.sleep(0.1)
-                continue
-            
-            try:
-                with sr.Microphone() as source:
-                    print("Listening...")
-                    audio = self.recognizer.listen(source, timeout=3, phrase_time_limit=3)
-                
-                try:
-                    command = self.recognizer.recognize_google(audio).lower()
-                    print("Voice command:", command)
-                    self.last_voice_time = time.time()
-                    
-                    if "start voice" in command or "begin voice" in command:
-                        self.voice_control_active = True
-                        self.update_ui_status()
-                    elif "stop voice" in command or "end voice" in command:
-                        self.voice_control_active = False
-                        self.update_ui_status()
-                    elif self.voice_control_active:
-                        if "click" in command:
-                            self.mouse.click(Button.left)
-                        elif "right click" in command:
-                            self.mouse.click(Button.right)
-                        elif "double click" in command:
-                            self.mouse.click(Button.left, 2)
-                        elif "scroll up" in command:
-                            self.mouse.scroll(0, 30)
-                        elif "scroll down" in command:
-                            self.mouse.scroll(0, -30)
-                        elif "drag" in command:
-                            pyautogui.mouseDown()
-                        elif "release" in command:
-                            pyautogui.mouseUp()
-                        elif "move up" in command:
-                            self.move_cursor('up')
-                        elif "move down" in command:
-                            self.move_cursor('down')
-                        elif "move left" in command:
-                            self.move_cursor('left')
-                        elif "move right" in command:
-                            self.move_cursor('right')
-                        elif "screenshot" in command:
-                            self.take_screenshot()
-                        elif "hod" in command:
-                            print('Senthil Murugan Sir....')
-                
-                except sr.UnknownValueError:
-                    print("Could not understand audio")
-                except sr.RequestError as e:
-                    print(f"Could not request results; {e}")
-            
-            except Exception as e:
-                print(f"Voice error: {e}")
+    def on_error(self, event):
+        messagebox.showerror(event.title, event.message)
     
-    def move_cursor(self, direction):
-        """Move cursor in specified direction"""
-        current_x, current_y = self.mouse.position
-        move_map = {
-            'up': (0, -self.VOICE_MOVE_SPEED),
-            'down': (0, self.VOICE_MOVE_SPEED),
-            'left': (-self.VOICE_MOVE_SPEED, 0),
-            'right': (self.VOICE_MOVE_SPEED, 0)
-        }
-        
-        dx, dy = move_map[direction]
-        new_x = current_x + dx
-        new_y = current_y + dy
-        
-        # Ensure cursor stays on screen
-        screen_width, screen_height = pyautogui.size()
-        new_x = max(0, min(screen_width, new_x))
-        new_y = max(0, min(screen_height, new_y))
-        
-        self.mouse.position = (new_x, new_y)
+    def on_grid_changed(self, event):
+        if event.bounds is None:
+            self.grid_overlay.hide()
+            # Let the window system unmap the overlay before the engine clicks
+            self.root.update_idletasks()
+            self.engine.grid_hidden.set()
+        else:
+            self.grid_overlay.show(event.bounds)
     
-    def update_ui_status(self):
+    def update_ui_status(self, state):
         """Update the status labels in the UI"""
-        hand_status = "ON" if self.hand_control_active else "OFF"
+        hand_status = "ON" if state.hand_active else "OFF"
         self.hand_status.config(text=f"Hand Control: {hand_status}")
+        self.hand_btn.config(
+            text="Disable Hand Control" if state.hand_active else "Enable Hand Control"
+        )
         
-        voice_status = "ON" if self.voice_control_active else "OFF"
+        voice_status = "ON" if state.voice_active else "OFF"
         self.voice_status.config(text=f"Voice Control: {voice_status}")
+        self.voice_btn.config(
+            text="Disable Voice Control" if state.voice_active else "Enable Voice Control"
+        )
     
     def on_close(self):
         """Clean up when closing the application"""
-        self.running = False
+        self.engine.stop()
+        self.bus.detach_tk()
         if self.camera_window:
             self.camera_window.destroy()
         self.root.destroy()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gesture & Voice Controlled Mouse")
+    parser.add_argument("--tracking-process", action="store_true",
+                        help="run capture and hand inference in a separate process")
+    parser.add_argument("--config", help="JSON file overriding the default settings")
+    args = parser.parse_args()
+    
     pyautogui.FAILSAFE = False
     root = tk.Tk()
-    app = VirtualMouseApp(root)
+    app = VirtualMouseApp(
+        root, config=load_config(args.config),
+        use_tracking_process=args.tracking_process
+    )
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,205 @@
+import heapq
+import itertools
+import threading
+import time
+
+import numpy as np
+
+# pyttsx3 drives the platform speech engine; without it feedback is muted
+try:
+    import pyttsx3
+    pyttsx3_available = True
+except ImportError:
+    pyttsx3_available = False
+
+# Lower values are spoken first
+PRIORITY_ERROR = 0
+PRIORITY_STATUS = 1
+PRIORITY_CONFIRM = 2
+
+
+class MutedBackend:
+    """Speaks nothing; records what would have been said"""
+
+    def __init__(self):
+        self.spoken = []
+        self.speaking = False
+
+    def say(self, text):
+        self.spoken.append(text)
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class Pyttsx3Backend:
+    """pyttsx3 engine owned by the feedback worker thread.
+
+    pyttsx3 engines must stay on the thread that created them, so the
+    engine is created lazily on the first ``say``. ``stop`` can be called
+    from any thread: it sets a flag that the engine's word callback acts
+    on, which is the way pyttsx3 supports interrupting an utterance.
+    ``speaking`` is set while an utterance is playing.
+    """
+
+    def __init__(self, rate=180, volume=1.0):
+        self.rate = rate
+        self.volume = volume
+        self._engine = None
+        self._cancel = threading.Event()
+        self.speaking = False
+
+    def say(self, text):
+        if self._engine is None:
+            self._engine = pyttsx3.init()
+            self._engine.connect("started-word", self._on_word)
+        self._engine.setProperty("rate", self.rate)
+        self._engine.setProperty("volume", self.volume)
+        self._cancel.clear()
+        self._engine.say(text)
+        self.speaking = True
+        try:
+            self._engine.runAndWait()
+        finally:
+            self.speaking = False
+
+    def _on_word(self, name, location, length):
+        if self._cancel.is_set():
+            self._engine.stop()
+
+    def stop(self):
+        self._cancel.set()
+
+    def close(self):
+        self.stop()
+
+
+class FeedbackService:
+    """Speaks short confirmations from a worker thread without blocking callers.
+
+    ``say`` only queues. Pending messages are kept in a priority queue of at
+    most ``max_pending`` entries; when it is full the least urgent message
+    is dropped. A message already pending is not queued again, and one
+    spoken less than ``coalesce_window`` seconds ago is dropped, so five
+    quick "scrolled" confirmations are heard once. ``cancel`` clears the
+    queue and cuts off the current utterance, e.g. when the user starts
+    speaking. ``speaking`` stays set for ``echo_tail`` seconds after an
+    utterance ends, while the room and the audio buffers still carry it.
+    """
+
+    def __init__(self, backend=None, max_pending=8, coalesce_window=2.0, echo_tail=0.3):
+        self.backend = backend or MutedBackend()
+        self.max_pending = max_pending
+        self.coalesce_window = coalesce_window
+        self.echo_tail = echo_tail
+        self._spoke_until = 0.0
+
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._pending = []
+        self._order = itertools.count()
+        self._last_spoken = {}
+        self._running = True
+        self._worker = threading.Thread(target=self._speak_loop, daemon=True)
+        self._worker.start()
+
+    def say(self, text, priority=PRIORITY_CONFIRM):
+        """Queue text to be spoken; returns False if it was coalesced or dropped"""
+        with self._lock:
+            if any(entry[2] == text for entry in self._pending):
+                return False
+            spoken_at = self._last_spoken.get(text)
+            if spoken_at is not None and time.monotonic() - spoken_at < self.coalesce_window:
+                return False
+
+            entry = (priority, next(self._order), text)
+            if len(self._pending) >= self.max_pending:
+                # Drop the least urgent, newest message if the new one beats it
+                least = max(self._pending)
+                if least < entry:
+                    return False
+                self._pending.remove(least)
+                heapq.heapify(self._pending)
+            heapq.heappush(self._pending, entry)
+            self._ready.notify()
+        return True
+
+    def cancel(self):
+        """Barge-in: drop everything pending and stop the current utterance"""
+        with self._lock:
+            self._pending = []
+        self.backend.stop()
+
+    def _speak_loop(self):
+        while True:
+            with self._lock:
+                while self._running and not self._pending:
+                    self._ready.wait()
+                if not self._running:
+                    break
+                _, _, text = heapq.heappop(self._pending)
+                self._last_spoken[text] = time.monotonic()
+            try:
+                self.backend.say(text)
+            except Exception as e:
+                print(f"Voice feedback error: {e}")
+            finally:
+                self._spoke_until = time.monotonic()
+
+    @property
+    def speaking(self):
+        """True while feedback is playing or its echo may still be heard"""
+        return self.backend.speaking or time.monotonic() - self._spoke_until < self.echo_tail
+
+    def close(self, timeout=2):
+        with self._lock:
+            self._running = False
+            self._pending = []
+            self._ready.notify()
+        self.backend.stop()
+        self._worker.join(timeout)
+        self.backend.close()
+
+
+class BargeInStream:
+    """Wraps a microphone stream and cuts feedback off when the user speaks over it.
+
+    The recognizer reads a Microphone's stream in chunks while it waits
+    for a phrase; this wrapper computes the level of each 16-bit chunk
+    read while ``feedback`` is speaking. The microphone hears the
+    feedback too, so only a chunk above ``threshold()`` times ``level``
+    counts as the user and calls ``feedback.cancel`` (once). ``overheard``
+    is set if a chunk loud enough to start a phrase (above ``threshold()``)
+    was read during feedback without such a barge-in, i.e. the captured
+    audio may be the feedback itself.
+    """
+
+    def __init__(self, stream, feedback, threshold, level):
+        self.stream = stream
+        self.feedback = feedback
+        self.threshold = threshold
+        self.level = level
+        self.barged_in = False
+        self.during_feedback = False
+
+    @property
+    def overheard(self):
+        return self.during_feedback and not self.barged_in
+
+    def read(self, size):
+        data = self.stream.read(size)
+        if not self.barged_in and self.feedback.speaking:
+            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
+            rms = np.sqrt(np.mean(samples * samples)) if samples.size else 0.0
+            if rms > self.threshold() * self.level:
+                self.barged_in = True
+                self.feedback.cancel()
+            elif rms > self.threshold():
+                self.during_feedback = True
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
@@ -0,0 +1,101 @@
+import math
+import threading
+import time
+
+from ticker import Ticker
+
+
+class CursorMotion:
+    """Moves the pointer continuously from a fixed-rate timer thread.
+
+    ``start`` sets a direction and the pointer keeps moving until ``stop``
+    or the next ``start``. Speed follows an ease-in curve from
+    ``min_speed`` to ``max_speed`` (pixels per second) over ``ramp_time``
+    seconds and is scaled by a gain that ``faster`` and ``slower`` adjust.
+    The thread sleeps while no motion is active.
+    """
+
+    GAIN_STEP = 1.5
+    MIN_GAIN = 0.25
+    MAX_GAIN = 4.0
+
+    def __init__(self, mouse, screen, rate=60, min_speed=150, max_speed=1500, ramp_time=1.5):
+        self.mouse = mouse
+        self.screen = screen
+        self.min_speed = min_speed
+        self.max_speed = max_speed
+        self.ramp_time = ramp_time
+        self.gain = 1.0
+
+        self._lock = threading.Lock()
+        self._direction = None
+        self._started = 0.0
+        self._position = (0, 0)
+        self._ticker = Ticker(self._tick, lambda: self.moving, rate, begin=self._begin)
+
+    @property
+    def rate(self):
+        """Pointer updates per second"""
+        return self._ticker.rate
+
+    @rate.setter
+    def rate(self, rate):
+        self._ticker.rate = rate
+
+    @property
+    def moving(self):
+        return self._direction is not None
+
+    def start(self, dx, dy):
+        """Start moving along (dx, dy), interrupting any current motion"""
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return
+        with self._lock:
+            self._direction = (dx / length, dy / length)
+            self._started = time.perf_counter()
+        self._ticker.wake()
+
+    def stop(self):
+        with self._lock:
+            self._direction = None
+
+    def faster(self):
+        self.gain = min(self.MAX_GAIN, self.gain * self.GAIN_STEP)
+
+    def slower(self):
+        self.gain = max(self.MIN_GAIN, self.gain / self.GAIN_STEP)
+
+    def speed(self, elapsed):
+        """Pixels per second after moving for elapsed seconds"""
+        ramp = min(1.0, elapsed / self.ramp_time) if self.ramp_time > 0 else 1.0
+        return (self.min_speed + (self.max_speed - self.min_speed) * ramp * ramp) * self.gain
+
+    def _begin(self):
+        # Sub-pixel remainder carried between ticks keeps slow motion smooth
+        self._position = self.mouse.position
+
+    def _tick(self, dt):
+        with self._lock:
+            direction, started = self._direction, self._started
+        if direction is None:
+            return False
+
+        x, y = self._position
+        step = self.speed(time.perf_counter() - started) * dt
+        target = (x + direction[0] * step, y + direction[1] * step)
+        clamped = self.screen.clamp(*target)
+        self.mouse.position = (round(clamped[0]), round(clamped[1]))
+
+        # Stop at the edge of the screen instead of pushing against it
+        if clamped != target:
+            with self._lock:
+                if self._direction is direction:
+                    self._direction = None
+            return False
+        self._position = clamped
+        return True
+
+    def close(self):
+        self._ticker.close()
+        self.stop()